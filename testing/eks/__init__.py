@@ -1,4 +0,0 @@
-"""
-Percona XtraDB Cluster Test Suite
-"""
-
@@ -1,10 +1,18 @@
 """
 Pytest configuration and shared fixtures for EKS test suite.
 """
+import functools
+import glob
+import hashlib
+import json
 import os
+import re
+from collections import namedtuple
 import pytest
 import yaml
 import sys
+import threading
+import warnings
 
 # Add the parent directory to the path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -27,6 +35,8 @@ CHARTMUSEUM_NAMESPACE = os.getenv('CHARTMUSEUM_NAMESPACE', 'chartmuseum')
 TEST_OPERATOR_NAMESPACE = os.getenv('TEST_OPERATOR_NAMESPACE', TEST_NAMESPACE)
 MINIO_NAMESPACE = os.getenv('MINIO_NAMESPACE', 'minio')
 CHAOS_NAMESPACE = os.getenv('CHAOS_NAMESPACE', 'litmus')
+# Comma-separated namespaces, each with its own PXC cluster, that `pytest -n N -m dr` spreads DR tests across
+DR_NAMESPACES = [ns.strip() for ns in os.getenv('DR_NAMESPACES', '').split(',') if ns.strip()]
 
 # EKS-specific defaults (no ON_PREM logic)
 ON_PREM = False  # Always False for EKS test suite
@@ -36,20 +46,92 @@ TOPOLOGY_KEY = os.getenv('TOPOLOGY_KEY', 'topology.kubernetes.io/zone')
 # Values file path (two directories up from testing/eks/ to project root, then into percona/)
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
 VALUES_FILE = os.path.join(PROJECT_ROOT, 'percona', 'templates', 'percona-values.yaml')
+# Resolved once at import; used as the values cache key
+_VALUES_FILE_REAL = os.path.realpath(VALUES_FILE)
+# Fleet-rendered manifest, read by the unit tests that check the generated custom resources
+FLEET_RENDERED_MANIFEST = os.getenv('FLEET_RENDERED_MANIFEST', '')
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+if not yaml.__with_libyaml__:
+    warnings.warn("PyYAML was built without libyaml; values parsing uses the slower pure-Python loader")
 
-def _load_values_yaml() -> dict:
-    """Load and parse the Percona values YAML file."""
-    with open(VALUES_FILE, 'r', encoding='utf-8') as f:
-        content = f.read()
-    # Replace common placeholders
-    content = content.replace('{{NODES}}', str(TEST_EXPECTED_NODES))
+
+# orjson is optional; it only speeds up the JSON sidecar cache below
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(value) -> bytes:
+        return json.dumps(value).encode('utf-8')
+    _json_loads = json.loads
+
+# Parsed YAML keyed by (path, sha256 of the parsed text) so each file is parsed once per session
+_YAML_CACHE = {}
+
+
+def _cached_yaml(path: str, parse, preprocess=None):
+    """
+    Return parse(text) for path, re-parsing only when the text changes.
+
+    Parsed results are also written to a `<path>.<sha256>.json` sidecar so
+    warm reruns decode JSON (with orjson when installed) instead of YAML;
+    stale sidecars are removed.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    if preprocess:
+        text = preprocess(text)
+    sha = hashlib.sha256(text.encode('utf-8')).hexdigest()
+    key = (path, sha)
+    if key in _YAML_CACHE:
+        return _YAML_CACHE[key]
+
+    sidecar = f"{path}.{sha}.json"
+    try:
+        with open(sidecar, 'rb') as f:
+            _YAML_CACHE[key] = _json_loads(f.read())
+        return _YAML_CACHE[key]
+    except (OSError, ValueError):
+        pass
+
+    value = parse(text)
+    _YAML_CACHE[key] = value
+    try:
+        dumped = _json_dumps(value)
+        # Only cache YAML that survives a JSON round trip (no dates, non-string keys, ...)
+        if _json_loads(dumped) == value:
+            for stale in glob.glob(f"{glob.escape(path)}.*.json"):
+                if stale != sidecar:
+                    os.remove(stale)
+            # Write then rename so parallel (xdist) workers never read a partial sidecar
+            tmp = f"{sidecar}.{os.getpid()}.tmp"
+            with open(tmp, 'wb') as f:
+                f.write(dumped)
+            os.replace(tmp, sidecar)
+    except (OSError, TypeError, ValueError):
+        pass
+    return value
+
+
+def _parse_values(content: str) -> dict:
     try:
-        return yaml.safe_load(content) or {}
+        return yaml.load(content, Loader=YAML_LOADER) or {}
     except Exception:
         return {}
 
 
+def _load_values_yaml() -> dict:
+    """Load and parse the Percona values YAML file."""
+    # Replace common placeholders
+    return _cached_yaml(
+        VALUES_FILE,
+        _parse_values,
+        preprocess=lambda content: content.replace('{{NODES}}', str(TEST_EXPECTED_NODES)),
+    )
+
+
 @pytest.fixture(scope='session')
 def values_norm():
     """
@@ -78,20 +160,189 @@ def pytest_addoption(parser):
     )
 
 
+def pytest_collection_modifyitems(config, items):
+    """Skip proxysql-marked tests at collection time unless --proxysql was given."""
+    if config.getoption("--proxysql"):
+        return
+    skip_proxysql = pytest.mark.skip(reason="ProxySQL tests run only with --proxysql")
+    for item in items:
+        if item.get_closest_marker("proxysql"):
+            item.add_marker(skip_proxysql)
+
+
+# Keyed by (realpath, mtime) so repeat calls skip the read and hash; bounded for long watch sessions
+@functools.lru_cache(maxsize=8)
+def _values_for_key(real_path: str, mtime_ns: int):
+    return _load_values_yaml(), VALUES_FILE
+
+
 def get_values_for_test():
     """
     Helper to get values dictionary and source path for tests.
     For EKS, always returns the raw percona-values.yaml.
+    The same (values, path) tuple is returned until the file changes; treat it as read-only.
+    """
+    return _values_for_key(_VALUES_FILE_REAL, os.stat(VALUES_FILE).st_mtime_ns)
+
+
+def flatten_values(obj, prefix: tuple = ()) -> dict:
+    """
+    Flatten parsed values into {key_path_tuple: value} for single-lookup access.
+    List items are keyed by index, e.g. ('pxc', 'affinity', 'podAntiAffinity',
+    'requiredDuringSchedulingIgnoredDuringExecution', 0, 'topologyKey').
+    Intermediate dicts/lists are kept too, so subtree lookups also work.
+    """
+    flat = {}
+    if isinstance(obj, dict):
+        items = obj.items()
+    elif isinstance(obj, list):
+        items = enumerate(obj)
+    else:
+        return flat
+    for key, val in items:
+        path = prefix + (key,)
+        flat[path] = val
+        flat.update(flatten_values(val, path))
+    return flat
+
+
+def _values_digest(values) -> str:
+    """Stable digest of parsed values, used to detect tests mutating shared data."""
+    return hashlib.sha256(json.dumps(values, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+@pytest.fixture(scope='session')
+def values_and_path():
+    """
+    (values, source_path) from get_values_for_test(), resolved once per session.
+    The dict is shared by every test in the session (or xdist worker), so it is
+    checked at teardown to make sure no test modified it in place.
+    """
+    values, path = get_values_for_test()
+    digest = _values_digest(values)
+    yield values, path
+    assert _values_digest(values) == digest, \
+        "A test mutated the shared session values; deepcopy before modifying"
+
+
+@pytest.fixture(scope='session')
+def values(values_and_path):
+    """Parsed values from values_and_path."""
+    return values_and_path[0]
+
+
+@pytest.fixture(scope='session')
+def path(values_and_path):
+    """Source path from values_and_path, used as the log_check source."""
+    return values_and_path[1]
+
+
+@pytest.fixture(scope='session')
+def values_flat(values_and_path):
+    """Values flattened once per session by flatten_values()."""
+    values, _ = values_and_path
+    return flatten_values(values)
+
+
+# Required anti-affinity rule list per component, checked once by anti_affinity_topology_keys
+_REQUIRED_ANTI_AFFINITY = {
+    component: (component, 'affinity', 'podAntiAffinity', 'requiredDuringSchedulingIgnoredDuringExecution')
+    for component in ('pxc', 'proxysql')
+}
+
+
+@pytest.fixture(scope='session')
+def anti_affinity_topology_keys(values_flat):
+    """
+    Topology keys of the required anti-affinity rules, per component.
+    The rule lists are validated once here; a missing or malformed list fails
+    with every offending path instead of a KeyError in each test.
+    """
+    keys, problems = {}, []
+    for component, rules_path in _REQUIRED_ANTI_AFFINITY.items():
+        rules = values_flat.get(rules_path)
+        if not isinstance(rules, list) or not all(isinstance(r, dict) for r in rules):
+            problems.append('.'.join(rules_path))
+            continue
+        keys[component] = frozenset(r.get('topologyKey') for r in rules)
+    if problems:
+        pytest.fail(f"Values file is missing anti-affinity rule lists: {', '.join(problems)}")
+    return keys
+
+
+# Top-level on/off switches read by the single-flag HA tests
+ValueFlags = namedtuple('ValueFlags', ['backup_enabled', 'pitr_enabled', 'proxysql_enabled', 'haproxy_enabled'])
+
+
+@pytest.fixture(scope='session')
+def flags(values_flat):
+    """ValueFlags pulled from values_flat once per session; a missing switch is None."""
+    return ValueFlags(
+        backup_enabled=values_flat.get(('backup', 'enabled')),
+        pitr_enabled=values_flat.get(('backup', 'pitr', 'enabled')),
+        proxysql_enabled=values_flat.get(('proxysql', 'enabled')),
+        haproxy_enabled=values_flat.get(('haproxy', 'enabled')),
+    )
+
+
+@pytest.fixture(scope='session')
+def schedules_by_name(values_and_path):
+    """Backup schedules keyed by schedule name."""
+    values, _ = values_and_path
+    return {s['name']: s for s in values.get('backup', {}).get('schedule', [])}
+
+
+# Cron format: minute hour day-of-month month day-of-week
+CRON_FIELDS = ('minute', 'hour', 'day_of_month', 'month', 'day_of_week')
+CRON_RE = re.compile(r'\s*(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s*')
+
+
+@pytest.fixture(scope='session')
+def parsed_schedules(values_and_path):
+    """
+    Backup schedules with their cron expression split into named fields once per session.
+    'cron' is None when the expression does not have exactly five fields.
+    """
+    values, _ = values_and_path
+    parsed = []
+    for s in values.get('backup', {}).get('schedule', []):
+        m = CRON_RE.fullmatch(s.get('schedule') or '')
+        parsed.append({
+            'name': s.get('name', 'unknown'),
+            'schedule': s.get('schedule'),
+            'cron': dict(zip(CRON_FIELDS, m.groups())) if m else None,
+            'retention': s.get('retention'),
+            'storageName': s.get('storageName'),
+        })
+    return parsed
+
+
+@pytest.fixture(scope='session')
+def template_text():
+    """Raw percona-values.yaml text with {{NODES}} unsubstituted, read once per session."""
+    with open(VALUES_FILE, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def find_manifest_doc(kind, predicate=None):
+    """
+    Return the first document of the given kind in FLEET_RENDERED_MANIFEST for
+    which predicate(doc) is true (any, if predicate is None), or None.
+    The manifest is streamed, so parsing stops at the match.
     """
-    path = VALUES_FILE
-    values = _load_values_yaml()
-    return (values, path)
+    with open(FLEET_RENDERED_MANIFEST, 'r', encoding='utf-8') as f:
+        for doc in yaml.load_all(f, Loader=YAML_LOADER):
+            if doc and doc.get('kind') == kind and (predicate is None or predicate(doc)):
+                return doc
+    return None
 
 
-def log_check(criterion: str, expected: str, actual: str, source: str = ""):
+def log_check(criterion: str, expected, actual, source: str = ""):
     """
     Log a criterion/result pair for test assertions in verbose mode.
     Only prints detailed information when verbose mode is enabled.
+    expected/actual may be strings or zero-arg callables returning strings;
+    callables are only invoked in verbose mode.
     
     Example:
       Criterion: pxc size should be in [3,5]
@@ -104,15 +355,54 @@ def log_check(criterion: str, expected: str, actual: str, source: str = ""):
     if not verbose:
         return
     
+    print(_format_check(criterion, expected, actual, source))
+
+
+def _format_check(criterion, expected, actual, source=""):
+    """
+    Render one criterion/result record as the three lines log_check prints.
+    expected/actual may be zero-arg callables so callers can defer building
+    the string until verbose mode actually needs it.
+    """
+    if callable(expected):
+        expected = expected()
+    if callable(actual):
+        actual = actual()
     prefix = "[dim]"
-    if source:
-        print(f"{prefix}Criterion: {criterion}")
-        print(f"{prefix}Expected:  {expected}")
-        print(f"{prefix}Actual:    {actual} (source: {source})")
-    else:
-        print(f"{prefix}Criterion: {criterion}")
-        print(f"{prefix}Expected:  {expected}")
-        print(f"{prefix}Actual:    {actual}")
+    suffix = f" (source: {source})" if source else ""
+    return (
+        f"{prefix}Criterion: {criterion}\n"
+        f"{prefix}Expected:  {expected}\n"
+        f"{prefix}Actual:    {actual}{suffix}"
+    )
+
+
+class _LogBatch:
+    """
+    Buffers log_check records for a single test and writes them in one call.
+    Records are only kept in verbose mode, mirroring log_check.
+    """
+
+    def __init__(self):
+        self.verbose = os.getenv('VERBOSE') == 'true'
+        self.buf = []
+
+    def check(self, criterion, expected, actual, source=""):
+        if self.verbose:
+            self.buf.append(_format_check(criterion, expected, actual, source))
+
+    def flush(self):
+        if self.buf:
+            sys.stdout.write("\n".join(self.buf) + "\n")
+            self.buf.clear()
+
+
+@pytest.fixture
+def log():
+    """Batched log_check for one test, flushed once at teardown."""
+    batch = _LogBatch()
+    yield batch
+    batch.flush()
 
 
 def pytest_runtest_setup(item):
@@ -195,6 +485,219 @@ def chartmuseum_port_forward():
     proc.wait()
 
 
+# Output of one 'helm template' run of the internal chart, shared by the helm render tests
+HelmRender = namedtuple('HelmRender', ['returncode', 'stdout', 'manifests'])
+
+
+@pytest.fixture(scope="session")
+def helm_rendered(chartmuseum_port_forward):
+    """
+    Render internal/pxc-db once per session and parse its non-empty documents.
+    Dependent tests are skipped when the chart cannot be rendered.
+    """
+    import subprocess
+
+    result = subprocess.run(
+        ['helm', 'template', 'test-chart', 'internal/pxc-db', '--namespace', TEST_NAMESPACE],
+        capture_output=True,
+        text=True,
+        timeout=30
+    )
+    if result.returncode != 0:
+        pytest.skip(f"Local ChartMuseum chart not available: {result.stderr}")
+    manifests = [doc for doc in yaml.load_all(result.stdout, Loader=YAML_LOADER) if doc]
+    return HelmRender(result.returncode, result.stdout, manifests)
+
+
+# urllib3 connections kept per host by the shared ApiClient (library default: 4)
+K8S_CONNECTION_POOL_MAXSIZE = int(os.getenv('K8S_CONNECTION_POOL_MAXSIZE', '32'))
+
+
+@pytest.fixture(scope="session")
+def k8s_client():
+    """
+    Initialize the Kubernetes API client shared by every *_v1 API fixture.
+    One ApiClient means one urllib3 pool, so TLS connections are reused across
+    API groups; the pool is sized for concurrent fan-out reads.
+    """
+    from kubernetes import client, config
+    try:
+        config.load_incluster_config()
+    except config.ConfigException:
+        try:
+            config.load_kube_config()
+        except Exception as e:
+            pytest.fail(f"Could not load Kubernetes config: {e}")
+
+    cfg = client.Configuration.get_default_copy()
+    cfg.connection_pool_maxsize = K8S_CONNECTION_POOL_MAXSIZE
+    # Ad-hoc client.XxxApi() calls (e.g. in chaos helpers) pick up the same settings
+    client.Configuration.set_default(cfg)
+    return client.ApiClient(configuration=cfg)
+
+
+@pytest.fixture(scope="session")
+def core_v1(k8s_client):
+    """Core V1 API client"""
+    from kubernetes import client
+    return client.CoreV1Api(k8s_client)
+
+
+@pytest.fixture(scope="session")
+def apps_v1(k8s_client):
+    """Apps V1 API client"""
+    from kubernetes import client
+    return client.AppsV1Api(k8s_client)
+
+
+@pytest.fixture(scope="session")
+def custom_objects_v1(k8s_client):
+    """Custom Objects V1 API client"""
+    from kubernetes import client
+    return client.CustomObjectsApi(k8s_client)
+
+
+@pytest.fixture(scope="session")
+def policy_v1(k8s_client):
+    """Policy V1 API client"""
+    from kubernetes import client
+    return client.PolicyV1Api(k8s_client)
+
+
+@pytest.fixture(scope="session")
+def dr_namespace(request):
+    """
+    Namespace of the cluster a DR test breaks. Under pytest-xdist each worker
+    gets its own entry of DR_NAMESPACES so concurrent chaos runs never touch the
+    same cluster; without it every test uses TEST_NAMESPACE.
+    """
+    worker_id = getattr(request.config, 'workerinput', {}).get('workerid', 'master')
+    if not DR_NAMESPACES or worker_id == 'master':
+        return TEST_NAMESPACE
+    return DR_NAMESPACES[int(worker_id.lstrip('gw')) % len(DR_NAMESPACES)]
+
+
+@pytest.fixture(scope="session")
+def mysql_pod(core_v1, dr_namespace):
+    """Name of a PXC pod in dr_namespace, looked up once per session"""
+    from resiliency.helpers import get_mysql_pod
+    return get_mysql_pod(core_v1, dr_namespace, TEST_CLUSTER_NAME)
+
+
+def _labels_match(labels, selector):
+    """Match an equality-based label selector ('a=b,c=d') against a labels dict"""
+    labels = labels or {}
+    terms = (term.partition('=') for term in selector.split(',') if term)
+    return all(labels.get(key.strip()) == value.strip() for key, _, value in terms)
+
+
+class K8sInformerCache:
+    """
+    List+Watch cache of namespaced objects, keyed by kind.
+    Each kind is listed once with resourceVersion=0 (served from the API
+    server's watch cache) and kept current by a background watch, so label
+    lookups are answered from memory instead of a LIST per test.
+    """
+
+    WATCH_TIMEOUT_SECONDS = 60
+
+    def __init__(self, namespace, **list_fns):
+        self.namespace = namespace
+        self._list_fns = list_fns
+        self._objects = {kind: {} for kind in list_fns}
+        self._watches = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    def start(self):
+        """Prime every kind synchronously, then keep it current in the background"""
+        for kind, list_fn in self._list_fns.items():
+            resource_version = self._relist(kind, list_fn)
+            threading.Thread(
+                target=self._watch, args=(kind, list_fn, resource_version), daemon=True
+            ).start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        for w in list(self._watches.values()):
+            w.stop()
+
+    def _relist(self, kind, list_fn):
+        result = list_fn(namespace=self.namespace, resource_version='0')
+        with self._lock:
+            self._objects[kind] = {obj.metadata.name: obj for obj in result.items}
+        return result.metadata.resource_version
+
+    def _watch(self, kind, list_fn, resource_version):
+        from kubernetes import watch
+
+        while not self._stopped.is_set():
+            w = self._watches[kind] = watch.Watch()
+            try:
+                for event in w.stream(
+                    list_fn,
+                    namespace=self.namespace,
+                    resource_version=resource_version,
+                    timeout_seconds=self.WATCH_TIMEOUT_SECONDS
+                ):
+                    obj = event['object']
+                    with self._lock:
+                        if event['type'] == 'DELETED':
+                            self._objects[kind].pop(obj.metadata.name, None)
+                        else:
+                            self._objects[kind][obj.metadata.name] = obj
+                resource_version = w.resource_version or resource_version
+            except Exception:
+                # Typically 410 Gone once resource_version leaves the watch window: relist
+                if self._stopped.wait(1):
+                    break
+                try:
+                    resource_version = self._relist(kind, list_fn)
+                except Exception:
+                    pass
+
+    def _by_label(self, kind, selector):
+        with self._lock:
+            objects = [obj for obj in self._objects[kind].values() if _labels_match(obj.metadata.labels, selector)]
+        return sorted(objects, key=lambda obj: obj.metadata.name)
+
+    def services_by_label(self, selector):
+        return self._by_label('services', selector)
+
+    def statefulsets_by_label(self, selector):
+        return self._by_label('statefulsets', selector)
+
+    def pods_by_label(self, selector):
+        return self._by_label('pods', selector)
+
+
+@pytest.fixture(scope="session")
+def k8s_cache_for(core_v1, apps_v1):
+    """Return a started K8sInformerCache per namespace, created on first use"""
+    caches = {}
+
+    def get(namespace):
+        if namespace not in caches:
+            caches[namespace] = K8sInformerCache(
+                namespace,
+                services=core_v1.list_namespaced_service,
+                statefulsets=apps_v1.list_namespaced_stateful_set,
+                pods=core_v1.list_namespaced_pod,
+            ).start()
+        return caches[namespace]
+
+    yield get
+    for cache in caches.values():
+        cache.stop()
+
+
+@pytest.fixture(scope="session")
+def k8s_cache(k8s_cache_for):
+    """Informer-style cache of Services, StatefulSets and Pods in the test namespace"""
+    return k8s_cache_for(TEST_NAMESPACE)
+
+
 # Fixture for resiliency tests to trigger chaos
 @pytest.fixture(scope="function")
 def trigger_chaos_for_resiliency_tests():
@@ -2,22 +2,19 @@
 Test that backup CronJobs exist (if using scheduled backups)
 """
 import pytest
-from kubernetes import client
-from kubernetes import client
-from conftest import TEST_NAMESPACE, TEST_CLUSTER_NAME, TEST_BACKUP_TYPE, TEST_BACKUP_BUCKET
+from conftest import TEST_NAMESPACE
 from rich.console import Console
 
 console = Console()
 
 @pytest.mark.integration
-def test_backup_cronjobs_exist(core_v1):
+def test_backup_cronjobs_exist(batch_v1):
     """Test that backup CronJobs exist (if using scheduled backups)"""
     # Note: This depends on the Percona operator creating CronJobs
     # Some versions use other mechanisms, so this test may need adjustment
 
     try:
         from kubernetes.client.rest import ApiException
-        batch_v1 = client.BatchV1Api()
         cronjobs = batch_v1.list_namespaced_cron_job(
             namespace=TEST_NAMESPACE,
             label_selector='app.kubernetes.io/managed-by=percona-xtradb-cluster-operator'
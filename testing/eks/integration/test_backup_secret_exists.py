@@ -2,9 +2,7 @@
 Test that backup credentials secret exists
 """
 import pytest
-from kubernetes import client
-from kubernetes import client
-from conftest import TEST_NAMESPACE, TEST_CLUSTER_NAME, TEST_BACKUP_TYPE, TEST_BACKUP_BUCKET
+from conftest import TEST_NAMESPACE
 from rich.console import Console
 
 console = Console()
@@ -5,8 +5,7 @@ import pytest
 import json
 import subprocess
 import yaml
-from kubernetes import client
-from conftest import TEST_NAMESPACE, TEST_CLUSTER_NAME, TEST_BACKUP_TYPE, TEST_BACKUP_BUCKET
+from conftest import TEST_NAMESPACE, TEST_CLUSTER_NAME
 from rich.console import Console
 
 console = Console()
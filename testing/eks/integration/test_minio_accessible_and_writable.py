@@ -4,9 +4,7 @@ Test MinIO accessibility and bucket write capability (S3-compatible)
 import pytest
 import base64
 import subprocess
-from kubernetes import client
-from kubernetes import client
-from conftest import TEST_NAMESPACE, TEST_CLUSTER_NAME, TEST_BACKUP_TYPE, TEST_BACKUP_BUCKET, MINIO_NAMESPACE
+from conftest import TEST_NAMESPACE, TEST_BACKUP_TYPE, TEST_BACKUP_BUCKET, MINIO_NAMESPACE
 from rich.console import Console
 
 console = Console()
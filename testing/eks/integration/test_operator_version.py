@@ -2,9 +2,7 @@
 Test that Percona Operator is installed and check its version
 """
 import pytest
-from kubernetes import client
-from kubernetes import client
-from conftest import kubectl_cmd, TEST_NAMESPACE, TEST_CLUSTER_NAME, TEST_EXPECTED_NODES
+from conftest import TEST_NAMESPACE
 from rich.console import Console
 
 console = Console()
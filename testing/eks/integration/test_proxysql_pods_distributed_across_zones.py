@@ -2,8 +2,7 @@
 Test that ProxySQL pods are distributed across availability zones
 """
 import pytest
-from kubernetes import client
-from conftest import TEST_NAMESPACE, TEST_EXPECTED_NODES
+from conftest import TEST_NAMESPACE
 from rich.console import Console
 
 console = Console()
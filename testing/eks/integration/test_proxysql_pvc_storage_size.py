@@ -2,9 +2,7 @@
 Test that ProxySQL PVCs have correct storage size (should be 5Gi or 8Gi depending on chart defaults)
 """
 import pytest
-from kubernetes import client
-from kubernetes import client
-from conftest import kubectl_cmd, TEST_NAMESPACE, TEST_CLUSTER_NAME, TEST_EXPECTED_NODES
+from conftest import TEST_NAMESPACE
 from rich.console import Console
 
 console = Console()
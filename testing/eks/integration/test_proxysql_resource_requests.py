@@ -2,28 +2,18 @@
 Test that ProxySQL pods have resource requests configured
 """
 import pytest
-from kubernetes import client
-from conftest import TEST_NAMESPACE
 from rich.console import Console
 
 console = Console()
 
 @pytest.mark.integration
-def test_proxysql_resource_requests(apps_v1):
+def test_proxysql_resource_requests(cluster_snapshot):
     """Test that ProxySQL pods have resource requests configured"""
-    # Get all StatefulSets and find ProxySQL by name pattern
-    sts_list = apps_v1.list_namespaced_stateful_set(namespace=TEST_NAMESPACE)
-    proxysql_sts = [sts for sts in sts_list.items if 'proxysql' in sts.metadata.name]
+    proxysql_sts = cluster_snapshot.sts_by_component['proxysql']
 
     assert len(proxysql_sts) > 0, "ProxySQL StatefulSet not found"
 
-    sts = proxysql_sts[0]
-    containers = sts.spec.template.spec.containers
-
-    proxysql_container = next(
-        (c for c in containers if 'proxysql' in c.name.lower()),
-        None
-    )
+    proxysql_container = cluster_snapshot.proxysql_container
 
     assert proxysql_container is not None, "ProxySQL container not found"
 
@@ -2,8 +2,7 @@
 Test that ProxySQL service exists
 """
 import pytest
-from kubernetes import client
-from conftest import TEST_NAMESPACE, TEST_CLUSTER_NAME
+from conftest import TEST_NAMESPACE
 from rich.console import Console
 
 console = Console()
@@ -2,9 +2,7 @@
 Test that PVCs exist for PXC pods
 """
 import pytest
-from kubernetes import client
-from kubernetes import client
-from conftest import kubectl_cmd, TEST_NAMESPACE, TEST_CLUSTER_NAME, TEST_EXPECTED_NODES
+from conftest import TEST_NAMESPACE, TEST_EXPECTED_NODES
 from rich.console import Console
 
 console = Console()
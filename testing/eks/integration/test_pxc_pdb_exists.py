@@ -2,24 +2,15 @@
 Test that PDB exists for PXC StatefulSet
 """
 import pytest
-from kubernetes import client
-from conftest import TEST_NAMESPACE
 from rich.console import Console
 
 console = Console()
 
 @pytest.mark.integration
-def test_pxc_pdb_exists(policy_v1):
+def test_pxc_pdb_exists(cluster_snapshot):
     """Test that PDB exists for PXC StatefulSet"""
     try:
-        pdb_list = policy_v1.list_namespaced_pod_disruption_budget(
-            namespace=TEST_NAMESPACE
-        )
-
-        pxc_pdbs = [
-            pdb for pdb in pdb_list.items
-            if 'pxc' in pdb.metadata.name.lower() and 'proxysql' not in pdb.metadata.name.lower()
-        ]
+        pxc_pdbs = cluster_snapshot.pdbs_by_component['pxc']
 
         assert len(pxc_pdbs) > 0, \
             "Pod Disruption Budget for PXC not found"
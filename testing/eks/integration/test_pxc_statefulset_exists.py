@@ -2,18 +2,15 @@
 Test that PXC StatefulSet exists
 """
 import pytest
-from kubernetes import client
-from conftest import TEST_NAMESPACE, TEST_CLUSTER_NAME, TEST_EXPECTED_NODES
+from conftest import TEST_EXPECTED_NODES
 from rich.console import Console
 
 console = Console()
 
 @pytest.mark.integration
-def test_pxc_statefulset_exists(apps_v1):
+def test_pxc_statefulset_exists(cluster_snapshot):
     """Test that PXC StatefulSet exists"""
-    # Get all StatefulSets and find PXC by name pattern
-    sts_list = apps_v1.list_namespaced_stateful_set(namespace=TEST_NAMESPACE)
-    pxc_sts = [sts for sts in sts_list.items if '-pxc' in sts.metadata.name and 'proxysql' not in sts.metadata.name]
+    pxc_sts = cluster_snapshot.sts_by_component['pxc']
 
     assert len(pxc_sts) > 0, "PXC StatefulSet not found"
 
@@ -2,8 +2,7 @@
 Test that StatefulSets use OrderedReady pod management
 """
 import pytest
-from kubernetes import client
-from conftest import TEST_NAMESPACE, TEST_CLUSTER_NAME, TEST_EXPECTED_NODES
+from conftest import TEST_NAMESPACE
 from rich.console import Console
 
 console = Console()
@@ -3,8 +3,7 @@ Test that gp3 storage class exists
 """
 import pytest
 from kubernetes import client
-from kubernetes import client
-from conftest import kubectl_cmd, TEST_NAMESPACE, TEST_CLUSTER_NAME, TEST_EXPECTED_NODES, ON_PREM, STORAGE_CLASS_NAME
+from conftest import ON_PREM, STORAGE_CLASS_NAME
 from rich.console import Console
 
 console = Console()
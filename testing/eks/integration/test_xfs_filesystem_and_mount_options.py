@@ -12,8 +12,6 @@ Background:
 - This test ensures infrastructure meets Percona best practices
 """
 import pytest
-import re
-from kubernetes import client
 from kubernetes.stream import stream
 from conftest import TEST_NAMESPACE
 from rich.console import Console
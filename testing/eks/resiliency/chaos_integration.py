@@ -17,8 +17,21 @@ TEST_NAMESPACE = os.getenv('TEST_NAMESPACE', 'percona')
 MTTR_TIMEOUT = int(os.getenv('RESILIENCY_MTTR_TIMEOUT_SECONDS', '120'))
 
 
+# urllib3 connections kept per host by the shared ApiClient (library default: 4)
+K8S_CONNECTION_POOL_MAXSIZE = int(os.getenv('K8S_CONNECTION_POOL_MAXSIZE', '32'))
+
+_api_client = None
+
+
 def load_k8s_config():
-    """Load Kubernetes configuration"""
+    """
+    Load Kubernetes configuration once and return the ApiClient shared by every
+    helper here, so chaos polling reuses one connection pool instead of opening
+    a fresh one per client.XxxApi() call.
+    """
+    global _api_client
+    if _api_client is not None:
+        return _api_client
     try:
         config.load_incluster_config()
         console.print("[dim]Using in-cluster Kubernetes config[/dim]")
@@ -29,12 +42,16 @@ def load_k8s_config():
         except Exception as e:
             console.print(f"[red]Failed to load Kubernetes config: {e}[/red]")
             raise
+    cfg = client.Configuration.get_default_copy()
+    cfg.connection_pool_maxsize = K8S_CONNECTION_POOL_MAXSIZE
+    _api_client = client.ApiClient(configuration=cfg)
+    return _api_client
 
 
 def get_chaos_engine_result(chaos_namespace: str, engine_name: str) -> Optional[Dict[str, Any]]:
     """Get the ChaosEngine result after experiment completes"""
     try:
-        custom_objects_v1 = client.CustomObjectsApi()
+        custom_objects_v1 = client.CustomObjectsApi(load_k8s_config())
         
         # Get ChaosEngine
         engine = custom_objects_v1.get_namespaced_custom_object(
@@ -83,6 +100,7 @@ def wait_for_chaos_completion(chaos_namespace: str, engine_name: str, timeout: i
     Returns:
         True if chaos completed successfully, False otherwise
     """
+    api_client = load_k8s_config()
     start_time = time.time()
     elapsed = 0
     check_count = 0
@@ -94,7 +112,7 @@ def wait_for_chaos_completion(chaos_namespace: str, engine_name: str, timeout: i
     
     # Quick check: Is chaos operator running?
     try:
-        core_v1 = client.CoreV1Api()
+        core_v1 = client.CoreV1Api(api_client)
         operator_pods = core_v1.list_namespaced_pod(
             namespace=chaos_namespace,
             label_selector='app.kubernetes.io/name=litmus'
@@ -115,7 +133,7 @@ def wait_for_chaos_completion(chaos_namespace: str, engine_name: str, timeout: i
         
         # Always check engine status (not just when printing)
         try:
-            custom_objects_v1 = client.CustomObjectsApi()
+            custom_objects_v1 = client.CustomObjectsApi(api_client)
             engine = custom_objects_v1.get_namespaced_custom_object(
                 group='litmuschaos.io',
                 version='v1alpha1',
@@ -152,8 +170,8 @@ def wait_for_chaos_completion(chaos_namespace: str, engine_name: str, timeout: i
             # Get detailed status information for display
             if engine:
                 try:
-                    core_v1 = client.CoreV1Api()
-                    batch_v1 = client.BatchV1Api()
+                    core_v1 = client.CoreV1Api(api_client)
+                    batch_v1 = client.BatchV1Api(api_client)
                     
                     engine_status = engine.get('status', {}).get('engineStatus', 'not-started')
                     experiments = engine.get('status', {}).get('experiments', [])
@@ -321,17 +339,17 @@ def trigger_resiliency_test(test_type: str, test_params: Dict[str, Any], mttr_ti
     console.print(f"[dim]MTTR timeout: {mttr_timeout}s[/dim]")
     
     # Import here to avoid circular dependencies
-    from tests.resiliency.helpers import (
+    from resiliency.helpers import (
         wait_for_pod_recovery,
         wait_for_statefulset_recovery,
         wait_for_service_recovery,
         wait_for_cluster_recovery
     )
     
-    load_k8s_config()
-    core_v1 = client.CoreV1Api()
-    apps_v1 = client.AppsV1Api()
-    custom_objects_v1 = client.CustomObjectsApi()
+    api_client = load_k8s_config()
+    core_v1 = client.CoreV1Api(api_client)
+    apps_v1 = client.AppsV1Api(api_client)
+    custom_objects_v1 = client.CustomObjectsApi(api_client)
     
     try:
         if test_type == 'pod_recovery':
@@ -451,10 +469,10 @@ def trigger_chaos_experiment(
     Returns:
         ChaosEngine name if successful, None otherwise
     """
-    load_k8s_config()
-    custom_objects_v1 = client.CustomObjectsApi()
-    apiextensions_v1 = client.ApiextensionsV1Api()
-    core_v1 = client.CoreV1Api()
+    api_client = load_k8s_config()
+    custom_objects_v1 = client.CustomObjectsApi(api_client)
+    apiextensions_v1 = client.ApiextensionsV1Api(api_client)
+    core_v1 = client.CoreV1Api(api_client)
     
     # First, check if LitmusChaos is installed by verifying CRD exists
     console.print(f"[dim]Checking if LitmusChaos CRDs are installed...[/dim]")
@@ -582,8 +600,8 @@ def run_resiliency_tests_with_chaos(
     
     # Check if LitmusChaos is installed
     try:
-        load_k8s_config()
-        core_v1 = client.CoreV1Api()
+        api_client = load_k8s_config()
+        core_v1 = client.CoreV1Api(api_client)
         core_v1.read_namespace(name=chaos_namespace)
     except Exception as e:
         console.print(f"[red]✗ LitmusChaos not found in namespace '{chaos_namespace}'[/red]")
@@ -611,8 +629,8 @@ def run_resiliency_tests_with_chaos(
     test_type = 'cluster_recovery'  # default
     
     # Get test parameters from cluster state
-    apps_v1 = client.AppsV1Api()
-    custom_objects_v1 = client.CustomObjectsApi()
+    apps_v1 = client.AppsV1Api(api_client)
+    custom_objects_v1 = client.CustomObjectsApi(api_client)
     
     test_params = {
         'namespace': app_namespace,
@@ -649,7 +667,7 @@ def run_resiliency_tests_with_chaos(
     
     # Cleanup chaos engine
     try:
-        custom_objects_v1 = client.CustomObjectsApi()
+        custom_objects_v1 = client.CustomObjectsApi(api_client)
         custom_objects_v1.delete_namespaced_custom_object(
             group='litmuschaos.io',
             version='v1alpha1',
@@ -3,9 +3,12 @@ Helper functions for resiliency tests with polling and MTTR checks
 """
 import time
 import os
+import logging
 from typing import Callable, Optional
+import pytest
+import urllib3
 from rich.console import Console
-from kubernetes import client
+from kubernetes import client, watch
 
 console = Console()
 
@@ -13,6 +16,16 @@ console = Console()
 DEFAULT_MTTR_TIMEOUT = int(os.getenv('RESILIENCY_MTTR_TIMEOUT_SECONDS', '120'))
 # Polling interval (15 seconds)
 POLL_INTERVAL = int(os.getenv('RESILIENCY_POLL_INTERVAL_SECONDS', '15'))
+# ChaosEngine names started by the session chaos fixture, keyed by component ('pxc', 'proxysql')
+CHAOS_ENGINES = pytest.StashKey[dict]()
+
+
+def log_banner(logger: logging.Logger, *lines: str) -> None:
+    """Log lines framed by '=' rules, as one record; nothing is built when INFO is off"""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    rule = '=' * 80
+    logger.info("\n".join([rule, *lines, rule]))
 
 
 def poll_until_condition(
@@ -69,6 +82,135 @@ def poll_until_condition(
     raise AssertionError(error_msg)
 
 
+def wait_via_watch(
+    api_list_fn: Callable,
+    namespace: str,
+    field_selector: str,
+    predicate: Callable[[object], bool],
+    timeout_seconds: int = DEFAULT_MTTR_TIMEOUT,
+    description: str = "condition",
+    fail_message: Optional[str] = None,
+    **list_kwargs
+) -> bool:
+    """
+    Watch objects matching a field selector until predicate(obj) returns True.
+    
+    Events are pushed by the API server, so the condition is observed as soon as
+    it happens instead of on the next poll interval. The initial ADDED events
+    reflect current state, so an object that is already healthy returns at once.
+    
+    Args:
+        api_list_fn: Namespaced list function, e.g. core_v1.list_namespaced_pod
+        namespace: Namespace to watch
+        field_selector: Field selector, e.g. 'metadata.name=my-pod'
+        predicate: Function that returns True when the watched object is healthy
+        timeout_seconds: Maximum time to wait (default: from env or 120s)
+        description: Description of what we're waiting for
+        fail_message: Custom failure message (default: auto-generated)
+        **list_kwargs: Extra arguments for api_list_fn, e.g. group/version/plural
+            for custom_objects_v1.list_namespaced_custom_object
+    
+    Returns:
+        True if condition was met
+    
+    Raises:
+        AssertionError if timeout is reached
+        client.exceptions.ApiException if the watch cannot be established
+        urllib3.exceptions.HTTPError if the watch connection breaks
+    """
+    start_time = time.time()
+    event_count = 0
+    
+    console.print(f"[cyan]Watching for {description}...[/cyan]")
+    console.print(f"[dim]Timeout: {timeout_seconds}s, field selector: {field_selector}[/dim]")
+    
+    deadline = start_time + timeout_seconds
+    w = watch.Watch()
+    try:
+        # The API server or a proxy may close the watch early; re-open it with the
+        # remaining time, resuming after the last event seen, until the deadline
+        while True:
+            remaining = int(deadline - time.time())
+            if remaining <= 0:
+                break
+            stream_kwargs = dict(list_kwargs)
+            if w.resource_version is not None:
+                stream_kwargs['resource_version'] = w.resource_version
+            for event in w.stream(
+                api_list_fn,
+                namespace=namespace,
+                field_selector=field_selector,
+                timeout_seconds=remaining,
+                **stream_kwargs
+            ):
+                event_count += 1
+                if event['type'] != 'DELETED' and predicate(event['object']):
+                    elapsed = time.time() - start_time
+                    console.print(f"[green]✓ Condition met: {description} (after {elapsed:.1f}s, {event_count} events)[/green]")
+                    return True
+                if time.time() >= deadline:
+                    break
+    finally:
+        w.stop()
+    
+    # Deadline passed without the condition being met
+    elapsed = time.time() - start_time
+    error_msg = fail_message or f"Timeout waiting for {description} after {elapsed:.1f}s ({event_count} events)"
+    console.print(f"[red]✗ {error_msg}[/red]")
+    raise AssertionError(error_msg)
+
+
+def _watch_or_poll(
+    poll_interval: int,
+    condition_func: Callable[[], bool],
+    timeout_seconds: int,
+    description: str,
+    fail_message: str,
+    **watch_kwargs
+) -> None:
+    """
+    Wait via wait_via_watch(**watch_kwargs) when poll_interval is 0, otherwise
+    poll condition_func every poll_interval seconds. A watch that cannot be
+    established, or whose connection breaks, falls back to polling at
+    POLL_INTERVAL for the rest of timeout_seconds.
+    """
+    start_time = time.time()
+    if not poll_interval:
+        try:
+            wait_via_watch(
+                timeout_seconds=timeout_seconds,
+                description=description,
+                fail_message=fail_message,
+                **watch_kwargs
+            )
+            return
+        except client.exceptions.ApiException as e:
+            console.print(f"[yellow]Watch unavailable ({e.status}), falling back to polling[/yellow]")
+        except urllib3.exceptions.HTTPError as e:
+            # Dropped or timed-out watch connection (ProtocolError, ReadTimeoutError, ...)
+            console.print(f"[yellow]Watch connection lost ({type(e).__name__}), falling back to polling[/yellow]")
+    poll_until_condition(
+        condition_func=condition_func,
+        timeout_seconds=max(1, int(timeout_seconds - (time.time() - start_time))),
+        poll_interval=poll_interval or POLL_INTERVAL,
+        description=description,
+        fail_message=fail_message
+    )
+
+
+def get_mysql_pod(core_v1: client.CoreV1Api, namespace: str, cluster_name: str) -> str:
+    """Get the first running PXC pod"""
+    pods = core_v1.list_namespaced_pod(
+        namespace=namespace,
+        label_selector=f"app.kubernetes.io/instance={cluster_name},app.kubernetes.io/component=pxc",
+        field_selector="status.phase=Running",
+        resource_version="0"
+    )
+    if not pods.items:
+        raise Exception(f"No running PXC pods found for cluster {cluster_name}")
+    return pods.items[0].metadata.name
+
+
 def check_pod_running(
     core_v1: client.CoreV1Api,
     namespace: str,
@@ -111,6 +253,11 @@ def check_statefulset_ready(
         raise
 
 
+def _endpoint_address_count(endpoints) -> int:
+    """Number of ready addresses across all subsets of an Endpoints object"""
+    return sum(len(subset.addresses or []) for subset in endpoints.subsets or [])
+
+
 def check_service_endpoints(
     core_v1: client.CoreV1Api,
     namespace: str,
@@ -120,13 +267,11 @@ def check_service_endpoints(
     """Check if service has minimum number of endpoints"""
     try:
         endpoints = core_v1.read_namespaced_endpoints(name=service_name, namespace=namespace)
-        addresses = []
-        for subset in endpoints.subsets or []:
-            addresses.extend([addr.ip for addr in subset.addresses or []])
+        address_count = _endpoint_address_count(endpoints)
         
-        has_endpoints = len(addresses) >= min_endpoints
+        has_endpoints = address_count >= min_endpoints
         if not has_endpoints:
-            console.print(f"[yellow]Service {service_name}: {len(addresses)} endpoints (need {min_endpoints})[/yellow]")
+            console.print(f"[yellow]Service {service_name}: {address_count} endpoints (need {min_endpoints})[/yellow]")
         return has_endpoints
     except client.exceptions.ApiException as e:
         if e.status == 404:
@@ -135,6 +280,28 @@ def check_service_endpoints(
         raise
 
 
+# group/version/plural of the PerconaXtraDBCluster custom resource
+PXC_CLUSTER_RESOURCE = {'group': 'pxc.percona.com', 'version': 'v1', 'plural': 'perconaxtradbclusters'}
+
+
+def _cluster_not_ready_reason(cr: dict, expected_nodes: int) -> Optional[str]:
+    """Why a PerconaXtraDBCluster object is not ready yet, or None if it is"""
+    status = cr.get('status', {})
+    state = status.get('state', 'unknown')
+    if state != 'ready':
+        return f"state {state} (expected: ready)"
+    
+    # Check PXC ready count
+    pxc_status = status.get('pxc', {})
+    if isinstance(pxc_status, dict):
+        pxc_ready = pxc_status.get('ready', 0)
+    else:
+        pxc_ready = pxc_status
+    if pxc_ready < expected_nodes:
+        return f"{pxc_ready}/{expected_nodes} PXC nodes ready"
+    return None
+
+
 def check_cluster_status_ready(
     custom_objects_v1: client.CustomObjectsApi,
     namespace: str,
@@ -144,29 +311,14 @@ def check_cluster_status_ready(
     """Check if Percona cluster status is ready"""
     try:
         cr = custom_objects_v1.get_namespaced_custom_object(
-            group='pxc.percona.com',
-            version='v1',
+            name=cluster_name,
             namespace=namespace,
-            plural='perconaxtradbclusters',
-            name=cluster_name
+            **PXC_CLUSTER_RESOURCE
         )
         
-        status = cr.get('status', {})
-        state = status.get('state', 'unknown')
-        
-        if state != 'ready':
-            console.print(f"[yellow]Cluster {cluster_name} state: {state} (expected: ready)[/yellow]")
-            return False
-        
-        # Check PXC ready count
-        pxc_status = status.get('pxc', {})
-        if isinstance(pxc_status, dict):
-            pxc_ready = pxc_status.get('ready', 0)
-        else:
-            pxc_ready = pxc_status
-        
-        if pxc_ready < expected_nodes:
-            console.print(f"[yellow]Cluster {cluster_name}: {pxc_ready}/{expected_nodes} PXC nodes ready[/yellow]")
+        not_ready = _cluster_not_ready_reason(cr, expected_nodes)
+        if not_ready:
+            console.print(f"[yellow]Cluster {cluster_name}: {not_ready}[/yellow]")
             return False
         
         return True
@@ -200,14 +352,20 @@ def wait_for_pod_recovery(
     core_v1: client.CoreV1Api,
     namespace: str,
     pod_name: str,
-    timeout_seconds: int = DEFAULT_MTTR_TIMEOUT
+    timeout_seconds: int = DEFAULT_MTTR_TIMEOUT,
+    poll_interval: int = 0
 ) -> None:
-    """Wait for a pod to be running after chaos event"""
-    poll_until_condition(
+    """Wait for a pod to be running after chaos event (poll_interval=0: watch)"""
+    _watch_or_poll(
+        poll_interval,
         condition_func=lambda: check_pod_running(core_v1, namespace, pod_name),
         timeout_seconds=timeout_seconds,
         description=f"pod {pod_name} to be Running",
-        fail_message=f"Pod {pod_name} did not recover to Running state within {timeout_seconds}s"
+        fail_message=f"Pod {pod_name} did not recover to Running state within {timeout_seconds}s",
+        api_list_fn=core_v1.list_namespaced_pod,
+        namespace=namespace,
+        field_selector=f'metadata.name={pod_name}',
+        predicate=lambda pod: pod.status.phase == 'Running'
     )
 
 
@@ -216,14 +374,20 @@ def wait_for_statefulset_recovery(
     namespace: str,
     statefulset_name: str,
     expected_replicas: int,
-    timeout_seconds: int = DEFAULT_MTTR_TIMEOUT
+    timeout_seconds: int = DEFAULT_MTTR_TIMEOUT,
+    poll_interval: int = 0
 ) -> None:
-    """Wait for StatefulSet to have all replicas ready after chaos event"""
-    poll_until_condition(
+    """Wait for StatefulSet to have all replicas ready after chaos event (poll_interval=0: watch)"""
+    _watch_or_poll(
+        poll_interval,
         condition_func=lambda: check_statefulset_ready(apps_v1, namespace, statefulset_name, expected_replicas),
         timeout_seconds=timeout_seconds,
         description=f"StatefulSet {statefulset_name} to have {expected_replicas} ready replicas",
-        fail_message=f"StatefulSet {statefulset_name} did not recover to {expected_replicas} ready replicas within {timeout_seconds}s"
+        fail_message=f"StatefulSet {statefulset_name} did not recover to {expected_replicas} ready replicas within {timeout_seconds}s",
+        api_list_fn=apps_v1.list_namespaced_stateful_set,
+        namespace=namespace,
+        field_selector=f'metadata.name={statefulset_name}',
+        predicate=lambda sts: (sts.status.ready_replicas or 0) == (sts.spec.replicas or expected_replicas)
     )
 
 
@@ -232,14 +396,20 @@ def wait_for_service_recovery(
     namespace: str,
     service_name: str,
     min_endpoints: int = 1,
-    timeout_seconds: int = DEFAULT_MTTR_TIMEOUT
+    timeout_seconds: int = DEFAULT_MTTR_TIMEOUT,
+    poll_interval: int = 0
 ) -> None:
-    """Wait for service to have endpoints after chaos event"""
-    poll_until_condition(
+    """Wait for service to have endpoints after chaos event (poll_interval=0: watch)"""
+    _watch_or_poll(
+        poll_interval,
         condition_func=lambda: check_service_endpoints(core_v1, namespace, service_name, min_endpoints),
         timeout_seconds=timeout_seconds,
         description=f"service {service_name} to have at least {min_endpoints} endpoint(s)",
-        fail_message=f"Service {service_name} did not recover endpoints within {timeout_seconds}s"
+        fail_message=f"Service {service_name} did not recover endpoints within {timeout_seconds}s",
+        api_list_fn=core_v1.list_namespaced_endpoints,
+        namespace=namespace,
+        field_selector=f'metadata.name={service_name}',
+        predicate=lambda endpoints: _endpoint_address_count(endpoints) >= min_endpoints
     )
 
 
@@ -248,13 +418,19 @@ def wait_for_cluster_recovery(
     namespace: str,
     cluster_name: str,
     expected_nodes: int,
-    timeout_seconds: int = DEFAULT_MTTR_TIMEOUT
+    timeout_seconds: int = DEFAULT_MTTR_TIMEOUT,
+    poll_interval: int = 0
 ) -> None:
-    """Wait for Percona cluster to be ready after chaos event"""
-    poll_until_condition(
+    """Wait for Percona cluster to be ready after chaos event (poll_interval=0: watch)"""
+    _watch_or_poll(
+        poll_interval,
         condition_func=lambda: check_cluster_status_ready(custom_objects_v1, namespace, cluster_name, expected_nodes),
         timeout_seconds=timeout_seconds,
         description=f"cluster {cluster_name} to be ready",
-        fail_message=f"Cluster {cluster_name} did not recover to ready state within {timeout_seconds}s"
+        fail_message=f"Cluster {cluster_name} did not recover to ready state within {timeout_seconds}s",
+        api_list_fn=custom_objects_v1.list_namespaced_custom_object,
+        namespace=namespace,
+        field_selector=f'metadata.name={cluster_name}',
+        predicate=lambda cr: _cluster_not_ready_reason(cr, expected_nodes) is None,
+        **PXC_CLUSTER_RESOURCE
     )
-
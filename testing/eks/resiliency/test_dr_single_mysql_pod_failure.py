@@ -8,20 +8,24 @@ RPO Target: 0 (no data loss)
 
 Delete a single PXC pod and verify cluster recovers
 """
+import logging
 import pytest
 from kubernetes import client
-from tests.resiliency.chaos_integration import trigger_chaos_experiment, wait_for_chaos_completion
-from tests.resiliency.helpers import (
+from resiliency.chaos_integration import trigger_chaos_experiment, wait_for_chaos_completion
+from resiliency.helpers import (
+    log_banner,
     wait_for_cluster_recovery,
     wait_for_statefulset_recovery,
     wait_for_service_recovery,
     wait_for_pod_recovery
 )
-from conftest import TEST_NAMESPACE, TEST_CLUSTER_NAME, CHAOS_NAMESPACE
+from conftest import TEST_CLUSTER_NAME, CHAOS_NAMESPACE
+
+logger = logging.getLogger("dr.single_mysql_pod")
 
 
 @pytest.mark.dr
-def test_single_mysql_pod_failure(core_v1, apps_v1, custom_objects_v1):
+def test_single_mysql_pod_failure(core_v1, apps_v1, custom_objects_v1, dr_namespace):
     """
     Delete a single PXC pod and verify cluster recovers
     
@@ -29,20 +33,21 @@ def test_single_mysql_pod_failure(core_v1, apps_v1, custom_objects_v1):
     Detection Signals: Pod CrashLoopBackOff; PXC node missing; HAProxy/ProxySQL health check fails
     Primary Recovery: K8s restarts pod; Percona Operator re‑joins PXC node automatically
     """
-    print(f"\n{'='*80}")
-    print(f"DR Scenario: Single MySQL pod failure (container crash / OOM)")
-    print(f"Business Impact: Low | Likelihood: Medium")
-    print(f"RTO: 5–10 minutes | RPO: 0 (no data loss)")
-    print(f"{'='*80}\n")
+    log_banner(
+        logger,
+        "DR Scenario: Single MySQL pod failure (container crash / OOM)",
+        "Business Impact: Low | Likelihood: Medium",
+        "RTO: 5–10 minutes | RPO: 0 (no data loss)"
+    )
     
     # Step 1: Trigger chaos experiment
-    print(f"[1/3] Triggering chaos: pod-delete")
-    print(f"      Target: statefulset with label 'app.kubernetes.io/component=pxc'")
-    print(f"      Duration: 60s, Interval: 10s\n")
+    logger.info("[1/3] Triggering chaos: pod-delete")
+    logger.info("      Target: statefulset with label 'app.kubernetes.io/component=pxc'")
+    logger.info("      Duration: 60s, Interval: 10s")
     
     engine_name = trigger_chaos_experiment(
         experiment_type="pod-delete",
-        app_namespace=TEST_NAMESPACE,
+        app_namespace=dr_namespace,
         app_label="app.kubernetes.io/component=pxc",
         app_kind="statefulset",
         total_chaos_duration=60,
@@ -50,30 +55,29 @@ def test_single_mysql_pod_failure(core_v1, apps_v1, custom_objects_v1):
     )
     
     assert engine_name is not None, "Failed to trigger chaos experiment"
-    print(f"✓ Chaos engine created: {engine_name}\n")
+    logger.info(f"✓ Chaos engine created: {engine_name}")
     
     # Step 2: Wait for chaos to complete
-    print(f"[2/3] Waiting for chaos experiment to complete...")
+    logger.info("[2/3] Waiting for chaos experiment to complete...")
     wait_for_chaos_completion(
         chaos_namespace=CHAOS_NAMESPACE,
         engine_name=engine_name,
         timeout=180
     )
-    print(f"✓ Chaos experiment completed\n")
+    logger.info("✓ Chaos experiment completed")
     
     # Step 3: Verify recovery based on expected_recovery type
-    print(f"[3/3] Verifying recovery: cluster_ready")
-    print(f"      Timeout: 600s, Poll interval: 15s\n")
+    logger.info("[3/3] Verifying recovery: cluster_ready")
+    logger.info("      Timeout: 600s, watching for changes")
     
     wait_for_cluster_recovery(
         custom_objects_v1=custom_objects_v1,
-        namespace=TEST_NAMESPACE,
+        namespace=dr_namespace,
         cluster_name=TEST_CLUSTER_NAME,
         expected_nodes=3,
-        timeout_seconds=600
+        timeout_seconds=600,
+        poll_interval=0  # watch instead of polling
     )
-    print(f"✓ Cluster {TEST_CLUSTER_NAME} recovered to ready state\n")
+    logger.info(f"✓ Cluster {TEST_CLUSTER_NAME} recovered to ready state")
     
-    print(f"{'='*80}")
-    print(f"✓ DR Scenario PASSED: Single MySQL pod failure (container crash / OOM)")
-    print(f"{'='*80}\n")
+    log_banner(logger, "✓ DR Scenario PASSED: Single MySQL pod failure (container crash / OOM)")
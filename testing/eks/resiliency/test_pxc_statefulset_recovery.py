@@ -6,7 +6,7 @@ import time
 import pytest
 from rich.console import Console
 from conftest import TEST_NAMESPACE, TEST_CLUSTER_NAME
-from tests.resiliency.helpers import (
+from resiliency.helpers import (
     wait_for_statefulset_recovery,
     DEFAULT_MTTR_TIMEOUT
 )
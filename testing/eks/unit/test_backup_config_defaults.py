@@ -1,8 +1,34 @@
+import functools
 import io
+import mmap
 import os
 import re
 import yaml
-from conftest import log_check
+from conftest import log_check, YAML_LOADER
+
+# clusterValues returns a template literal; compile the delimiters once per session
+_START_RE = re.compile(r"function\s+clusterValues\([\s\S]*?return\s+`")
+_END_RE = re.compile(r"\n`\;?\}\s*$", re.MULTILINE)
+# Byte patterns for the mmap scan in read_cluster_values_source
+_FUNCTION_RE = re.compile(rb"function\s+clusterValues\(")
+_TEMPLATE_CLOSE_RE = re.compile(rb"return\s+`[\s\S]*?\n`")
+
+
+def read_cluster_values_source(ts_file: str) -> str:
+    """Return the clusterValues function from src/percona.ts, through the line closing its template literal.
+
+    The file is scanned as bytes through mmap and only that slice is decoded to str.
+    """
+    with io.open(ts_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        m_fn = _FUNCTION_RE.search(mm)
+        if not m_fn:
+            return ""
+        m_close = _TEMPLATE_CLOSE_RE.search(mm, m_fn.start())
+        if not m_close:
+            return mm[m_fn.start():].decode("utf-8")
+        line_end = mm.find(b"\n", m_close.end())
+        end = len(mm) if line_end == -1 else line_end + 1
+        return mm[m_fn.start():end].decode("utf-8")
 
 
 def extract_backup_yaml_from_cluster_values(ts_source: str) -> str:
@@ -11,19 +37,20 @@ def extract_backup_yaml_from_cluster_values(ts_source: str) -> str:
     Returns the YAML text starting with 'backup:' and its nested content.
     """
     # Locate the start of the template literal returned by clusterValues
-    m_start = re.search(r"function\s+clusterValues\([\s\S]*?return\s+`", ts_source)
+    m_start = _START_RE.search(ts_source)
     if not m_start:
         raise AssertionError("clusterValues template literal not found")
 
     start_idx = m_start.end()
     # Find the end backtick corresponding to the template
-    m_end = re.search(r"\n`\;?\}\s*$", ts_source[start_idx:], re.MULTILINE)
-    if not m_end:
+    m_end = _END_RE.search(ts_source, start_idx)
+    if m_end:
+        end_idx = m_end.start()
+    else:
         # Fallback: first closing backtick
-        m_end = re.search(r"`", ts_source[start_idx:])
-        if not m_end:
+        end_idx = ts_source.find("`", start_idx)
+        if end_idx == -1:
             raise AssertionError("clusterValues template literal closing backtick not found")
-    end_idx = start_idx + m_end.start()
 
     yaml_text = ts_source[start_idx:end_idx]
 
@@ -31,7 +58,7 @@ def extract_backup_yaml_from_cluster_values(ts_source: str) -> str:
     lines = yaml_text.splitlines()
     backup_start = None
     for i, line in enumerate(lines):
-        if re.match(r"^backup:\s*$", line):
+        if line.rstrip() == "backup:":
             backup_start = i
             break
     if backup_start is None:
@@ -40,79 +67,82 @@ def extract_backup_yaml_from_cluster_values(ts_source: str) -> str:
     # Capture lines until next top-level key (non-indented) or end of template
     captured = [lines[backup_start]]
     for line in lines[backup_start + 1 :]:
-        if re.match(r"^[^\s]", line):
+        if line and not line[0].isspace():
             break
         captured.append(line)
 
     return "\n".join(captured) + "\n"
 
 
-def test_backup_configuration_defaults_match_source():
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-    ts_file = os.path.join(project_root, "src", "percona.ts")
-
-    with io.open(ts_file, "r", encoding="utf-8") as f:
-        ts_source = f.read()
-
-    backup_yaml = extract_backup_yaml_from_cluster_values(ts_source)
-
-    # Load just the backup subtree for structural comparison
-    loaded = yaml.safe_load(backup_yaml)
-
-    # Expected structure — if any value changes, this test should fail
-    expected = {
-        "backup": {
+# Expected structure — if any value changes, this test should fail
+_EXPECTED_BACKUP = {
+    "backup": {
+        "enabled": True,
+        "pitr": {
             "enabled": True,
-            "pitr": {
-                "enabled": True,
+            "storageName": "minio-backup",
+            "timeBetweenUploads": 60,
+        },
+        "storages": {
+            "minio-backup": {
+                "type": "s3",
+                "s3": {
+                    "bucket": "percona-backups",
+                    "region": "us-east-1",
+                    "endpoint": "http://minio.minio.svc.cluster.local:9000",
+                    "credentialsSecret": "percona-backup-minio-credentials",
+                },
+            }
+        },
+        "schedule": [
+            {
+                "name": "daily-backup",
+                "schedule": "0 2 * * *",
+                "retention": {
+                    "type": "count",
+                    "count": 7,
+                    "deleteFromStorage": True,
+                },
                 "storageName": "minio-backup",
-                "timeBetweenUploads": 60,
             },
-            "storages": {
-                "minio-backup": {
-                    "type": "s3",
-                    "s3": {
-                        "bucket": "percona-backups",
-                        "region": "us-east-1",
-                        "endpoint": "http://minio.minio.svc.cluster.local:9000",
-                        "credentialsSecret": "percona-backup-minio-credentials",
-                    },
-                }
-            },
-            "schedule": [
-                {
-                    "name": "daily-backup",
-                    "schedule": "0 2 * * *",
-                    "retention": {
-                        "type": "count",
-                        "count": 7,
-                        "deleteFromStorage": True,
-                    },
-                    "storageName": "minio-backup",
-                },
-                {
-                    "name": "weekly-backup",
-                    "schedule": "0 1 * * 0",
-                    "retention": {
-                        "type": "count",
-                        "count": 8,
-                        "deleteFromStorage": True,
-                    },
-                    "storageName": "minio-backup",
+            {
+                "name": "weekly-backup",
+                "schedule": "0 1 * * 0",
+                "retention": {
+                    "type": "count",
+                    "count": 8,
+                    "deleteFromStorage": True,
                 },
-                {
-                    "name": "monthly-backup",
-                    "schedule": "30 1 1 * *",
-                    "retention": {
-                        "type": "count",
-                        "count": 12,
-                        "deleteFromStorage": True,
-                    },
-                    "storageName": "minio-backup",
+                "storageName": "minio-backup",
+            },
+            {
+                "name": "monthly-backup",
+                "schedule": "30 1 1 * *",
+                "retention": {
+                    "type": "count",
+                    "count": 12,
+                    "deleteFromStorage": True,
                 },
-            ],
-        }
+                "storageName": "minio-backup",
+            },
+        ],
     }
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _load_backup_subtree(ts_file: str, mtime: float) -> dict:
+    """Parse the clusterValues backup subtree; mtime is part of the cache key so edited files are re-read."""
+    backup_yaml = extract_backup_yaml_from_cluster_values(read_cluster_values_source(ts_file))
+    return yaml.load(backup_yaml, Loader=YAML_LOADER)
+
+
+def test_backup_configuration_defaults_match_source():
+    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+    ts_file = os.path.join(project_root, "src", "percona.ts")
+
+    # Load just the backup subtree for structural comparison
+    loaded = _load_backup_subtree(ts_file, os.path.getmtime(ts_file))
 
     # Emit criterion/result comparison before assertion
     criterion = "Backup subtree in src/percona.ts must match expected default structure"
@@ -120,7 +150,7 @@ def test_backup_configuration_defaults_match_source():
     actual_desc = f"loaded keys={sorted(list(loaded.get('backup', {}).keys()))}"
     log_check(criterion=criterion, expected=expected_desc, actual=actual_desc, source=ts_file)
 
-    assert loaded == expected, (
+    assert loaded == _EXPECTED_BACKUP, (
         "Backup configuration in src/percona.ts has changed.\n"
         "Update schedules/PITR/retention intentionally and adjust this test, or revert the change."
     )
@@ -3,251 +3,145 @@ Unit tests for backup configuration validation.
 Validates backup schedules, retention, PITR, and storage configuration per Percona v1.18 best practices.
 """
 import os
+import re
 import yaml
 import pytest
-import re
-from conftest import log_check
-from datetime import datetime
+from conftest import log_check, YAML_LOADER, CRON_RE
+
+# Keys every S3-compatible backup storage must define
+_REQUIRED_S3_KEYS = frozenset({'bucket', 'region', 'endpointUrl', 'credentialsSecret'})
 
+# Off-peak cron hour field: hours 1-3 only, as a single value, list or range (e.g. "2", "1,3", "1-3")
+_OFFPEAK_HOUR = re.compile(r'[1-3](?:[,-][1-3])*')
 
-def parse_cron_schedule(schedule):
-    """Parse cron schedule and validate format."""
-    # Cron format: minute hour day-of-month month day-of-week
-    parts = schedule.split()
-    assert len(parts) == 5, f"Invalid cron format: {schedule}"
-    return {
-        'minute': parts[0],
-        'hour': parts[1],
-        'day_of_month': parts[2],
-        'month': parts[3],
-        'day_of_week': parts[4],
-    }
+
+def assert_cron_format(schedule):
+    """Assert schedule has the five cron fields, without building the parsed dict."""
+    assert CRON_RE.fullmatch(schedule), f"Invalid cron format: {schedule}"
 
 
 @pytest.mark.unit
-def test_backup_enabled():
+def test_backup_enabled(values, path):
     """Test that backups are enabled."""
-    path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'percona', 'templates', 'percona-values.yaml')
-    with open(path, 'r', encoding='utf-8') as f:
-        content = f.read()
-        content = content.replace('{{NODES}}', '3')
-        values = yaml.safe_load(content)
-    
-    log_check("Backups must be enabled", "True", f"{values['backup']['enabled']}", source=path); assert values['backup']['enabled'] is True, "Backups must be enabled"
+    enabled = values['backup']['enabled']
+    log_check("Backups must be enabled", "True", lambda: f"{enabled}", source=path); assert enabled is True, "Backups must be enabled"
 
 
 @pytest.mark.unit
-def test_pitr_enabled():
+def test_pitr_enabled(values, path):
     """Test that Point-in-Time Recovery (PITR) is enabled."""
-    path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'percona', 'templates', 'percona-values.yaml')
-    with open(path, 'r', encoding='utf-8') as f:
-        content = f.read()
-        content = content.replace('{{NODES}}', '3')
-        values = yaml.safe_load(content)
-    
-    log_check("PITR must be enabled", "True", f"{values['backup']['pitr']['enabled']}", source=path); assert values['backup']['pitr']['enabled'] is True, "PITR must be enabled for point-in-time recovery"
+    enabled = values['backup']['pitr']['enabled']
+    log_check("PITR must be enabled", "True", lambda: f"{enabled}", source=path); assert enabled is True, "PITR must be enabled for point-in-time recovery"
 
 
 @pytest.mark.unit
-def test_pitr_time_between_uploads():
+def test_pitr_time_between_uploads(values, path):
     """Test that PITR timeBetweenUploads is configured appropriately."""
-    path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'percona', 'templates', 'percona-values.yaml')
-    with open(path, 'r', encoding='utf-8') as f:
-        content = f.read()
-        content = content.replace('{{NODES}}', '3')
-        values = yaml.safe_load(content)
-    
     time_between_uploads = values['backup']['pitr']['timeBetweenUploads']
     
     # Should be between 30-300 seconds for reasonable RPO
     # 60 seconds is a good balance
-    log_check("PITR timeBetweenUploads between 30-300s", "30..300", f"{time_between_uploads}", source=path)
+    log_check("PITR timeBetweenUploads between 30-300s", "30..300", lambda: f"{time_between_uploads}", source=path)
     assert 30 <= time_between_uploads <= 300, \
         "PITR timeBetweenUploads should be between 30-300 seconds for reasonable RPO"
 
 
 @pytest.mark.unit
-def test_backup_storage_configuration():
+def test_backup_storage_configuration(values, path, log):
     """Test that backup storage is properly configured."""
-    path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'percona', 'templates', 'percona-values.yaml')
-    with open(path, 'r', encoding='utf-8') as f:
-        content = f.read()
-        content = content.replace('{{NODES}}', '3')
-        values = yaml.safe_load(content)
-    
     storages = values['backup']['storages']
-    log_check("backup.storages must include minio-backup", "present", f"present={'minio-backup' in storages}", source=path); assert 'minio-backup' in storages
+    log.check("backup.storages must include minio-backup", "present", lambda: f"present={'minio-backup' in storages}", source=path); assert 'minio-backup' in storages
     
     storage = storages['minio-backup']
-    log_check("backup storage type", "s3", f"{storage['type']}", source=path); assert storage['type'] == 's3', "Storage type should be s3 (S3-compatible)"
+    log.check("backup storage type", "s3", lambda: f"{storage['type']}", source=path); assert storage['type'] == 's3', "Storage type should be s3 (S3-compatible)"
     
     s3_config = storage['s3']
-    for key in ['bucket','region','endpointUrl','credentialsSecret']:
-        log_check(f"s3 config must include {key}", "present", f"present={key in s3_config}", source=path); assert key in s3_config
-    log_check("s3.forcePathStyle must be True", "True", f"{s3_config.get('forcePathStyle')}", source=path); assert s3_config.get('forcePathStyle') is True, "MinIO requires forcePathStyle=true"
+    missing = _REQUIRED_S3_KEYS.difference(s3_config)
+    log.check("s3 config keys", "all present", lambda: f"missing={sorted(missing)}", source=path); assert not missing, f"s3 config must include {sorted(missing)}"
+    log.check("s3.forcePathStyle must be True", "True", lambda: f"{s3_config.get('forcePathStyle')}", source=path); assert s3_config.get('forcePathStyle') is True, "MinIO requires forcePathStyle=true"
 
 
 @pytest.mark.unit
-def test_backup_schedules_exist():
+def test_backup_schedules_exist(values, path, schedules_by_name):
     """Test that backup schedules are configured."""
-    path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'percona', 'templates', 'percona-values.yaml')
-    with open(path, 'r', encoding='utf-8') as f:
-        content = f.read()
-        content = content.replace('{{NODES}}', '3')
-        values = yaml.safe_load(content)
-    
-    schedules = values['backup']['schedule']
-    log_check("At least one backup schedule configured", "> 0", f"{len(schedules)}", source=path); assert len(schedules) > 0, "At least one backup schedule must be configured"
-    
-    # Should have daily, weekly, and monthly backups
-    schedule_names = [s['name'] for s in schedules]
-    log_check("Schedule names should include daily/weekly/monthly", "present", f"{schedule_names}", source=path); assert 'daily-backup' in schedule_names
-    assert 'weekly-backup' in schedule_names
-    assert 'monthly-backup' in schedule_names
-
-
-@pytest.mark.unit
-def test_daily_backup_schedule():
-    """Test daily backup schedule configuration."""
-    path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'percona', 'templates', 'percona-values.yaml')
-    with open(path, 'r', encoding='utf-8') as f:
-        content = f.read()
-        content = content.replace('{{NODES}}', '3')
-        values = yaml.safe_load(content)
-    
-    schedules = values['backup']['schedule']
-    daily = next(s for s in schedules if s['name'] == 'daily-backup')
-    
-    # Validate cron schedule format
-    cron = parse_cron_schedule(daily['schedule'])
-    log_check("Daily cron", "0 2 * * *", f"{daily['schedule']}", source=path); assert daily['schedule'] == '0 2 * * *', "Daily backup should run at 2 AM"
-    
-    # Validate retention
-    retention = daily['retention']
-    log_check("Daily retention.type", "count", f"{retention['type']}", source=path); assert retention['type'] == 'count'
-    log_check("Daily retention.count >= 7", ">= 7", f"{retention['count']}", source=path); assert retention['count'] >= 7, "Daily backups should retain at least 7 days"
-    log_check("Daily deleteFromStorage", "True", f"{retention.get('deleteFromStorage')}", source=path); assert retention.get('deleteFromStorage') is True, "Old backups should be deleted from storage"
-    
-    assert daily['storageName'] == 'minio-backup'
-
-
-@pytest.mark.unit
-def test_weekly_backup_schedule():
-    """Test weekly backup schedule configuration."""
-    path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'percona', 'templates', 'percona-values.yaml')
-    with open(path, 'r', encoding='utf-8') as f:
-        content = f.read()
-        content = content.replace('{{NODES}}', '3')
-        values = yaml.safe_load(content)
-    
     schedules = values['backup']['schedule']
-    weekly = next(s for s in schedules if s['name'] == 'weekly-backup')
+    log_check("At least one backup schedule configured", "> 0", lambda: f"{len(schedules)}", source=path); assert len(schedules) > 0, "At least one backup schedule must be configured"
     
-    # Validate cron schedule format
-    cron = parse_cron_schedule(weekly['schedule'])
-    log_check("Weekly cron", "0 1 * * 0", f"{weekly['schedule']}", source=path); assert weekly['schedule'] == '0 1 * * 0', "Weekly backup should run Sunday at 1 AM"
-    
-    # Validate retention
-    retention = weekly['retention']
-    log_check("Weekly retention.type", "count", f"{retention['type']}", source=path); assert retention['type'] == 'count'
-    log_check("Weekly retention.count >= 4", ">= 4", f"{retention['count']}", source=path); assert retention['count'] >= 4, "Weekly backups should retain at least 4 weeks (1 month)"
-    log_check("Weekly deleteFromStorage", "True", f"{retention.get('deleteFromStorage')}", source=path); assert retention.get('deleteFromStorage') is True
-    
-    assert weekly['storageName'] == 'minio-backup'
+    # Should have daily, weekly, and monthly backups (hash lookups on the name-keyed index)
+    log_check("Schedule names should include daily/weekly/monthly", "present", lambda: f"{list(schedules_by_name)}", source=path); assert 'daily-backup' in schedules_by_name
+    assert 'weekly-backup' in schedules_by_name
+    assert 'monthly-backup' in schedules_by_name
 
 
 @pytest.mark.unit
-def test_monthly_backup_schedule():
-    """Test monthly backup schedule configuration."""
-    path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'percona', 'templates', 'percona-values.yaml')
-    with open(path, 'r', encoding='utf-8') as f:
-        content = f.read()
-        content = content.replace('{{NODES}}', '3')
-        values = yaml.safe_load(content)
-    
-    schedules = values['backup']['schedule']
-    monthly = next(s for s in schedules if s['name'] == 'monthly-backup')
+@pytest.mark.parametrize("name,expected_cron,when,min_retention,retention_span", [
+    ("daily-backup", "0 2 * * *", "at 2 AM", 7, "7 days"),
+    ("weekly-backup", "0 1 * * 0", "Sunday at 1 AM", 4, "4 weeks (1 month)"),
+    ("monthly-backup", "30 1 1 * *", "on 1st of month at 1:30 AM", 12, "12 months (1 year)"),
+], ids=["daily", "weekly", "monthly"])
+def test_backup_schedule(schedules_by_name, path, name, expected_cron, when, min_retention, retention_span):
+    """Test daily/weekly/monthly backup schedule configuration."""
+    schedule = schedules_by_name.get(name)
+    assert schedule is not None, f"{name} schedule must be configured"
     
     # Validate cron schedule format
-    cron = parse_cron_schedule(monthly['schedule'])
-    log_check("Monthly cron", "30 1 1 * *", f"{monthly['schedule']}", source=path); assert monthly['schedule'] == '30 1 1 * *', "Monthly backup should run on 1st of month at 1:30 AM"
+    cron = schedule['schedule']
+    assert_cron_format(cron)
+    log_check(f"{name} cron", expected_cron, lambda: f"{cron}", source=path); assert cron == expected_cron, f"{name} should run {when}"
     
     # Validate retention
-    retention = monthly['retention']
-    log_check("Monthly retention.type", "count", f"{retention['type']}", source=path); assert retention['type'] == 'count'
-    log_check("Monthly retention.count >= 12", ">= 12", f"{retention['count']}", source=path); assert retention['count'] >= 12, "Monthly backups should retain at least 12 months (1 year)"
-    log_check("Monthly deleteFromStorage", "True", f"{retention.get('deleteFromStorage')}", source=path); assert retention.get('deleteFromStorage') is True
+    retention = schedule['retention']
+    log_check(f"{name} retention.type", "count", lambda: f"{retention['type']}", source=path); assert retention['type'] == 'count'
+    log_check(f"{name} retention.count >= {min_retention}", lambda: f">= {min_retention}", lambda: f"{retention['count']}", source=path); assert retention['count'] >= min_retention, f"{name} should retain at least {retention_span}"
+    log_check(f"{name} deleteFromStorage", "True", lambda: f"{retention.get('deleteFromStorage')}", source=path); assert retention.get('deleteFromStorage') is True, "Old backups should be deleted from storage"
     
-    assert monthly['storageName'] == 'minio-backup'
+    assert schedule['storageName'] == 'minio-backup'
 
 
 @pytest.mark.unit
-def test_backup_retention_policy():
+def test_backup_retention_policy(parsed_schedules, path, log):
     """Test that backup retention policies are appropriate."""
-    path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'percona', 'templates', 'percona-values.yaml')
-    with open(path, 'r', encoding='utf-8') as f:
-        content = f.read()
-        content = content.replace('{{NODES}}', '3')
-        values = yaml.safe_load(content)
-    
-    schedules = values['backup']['schedule']
-    
-    for schedule in schedules:
-        retention = schedule['retention']
-        
-        # All schedules should use count-based retention
-        assert retention['type'] == 'count', "Retention type should be 'count'"
-        assert 'count' in retention
-        assert retention['count'] > 0, "Retention count must be positive"
-        
-        # Old backups should be deleted from storage to save space
-        assert retention.get('deleteFromStorage') is True, \
-            "deleteFromStorage should be enabled to prevent storage bloat"
+    # All schedules should use positive count-based retention and delete old backups from storage
+    bad = [
+        (s['name'], s['retention']) for s in parsed_schedules
+        if s['retention'].get('type') != 'count'
+        or s['retention'].get('count', 0) <= 0
+        or s['retention'].get('deleteFromStorage') is not True
+    ]
+    log.check("Retention: type=count, count > 0, deleteFromStorage=True", "no invalid schedules", lambda: f"invalid={bad}", source=path)
+    assert not bad, f"invalid retention: {bad}"
 
 
 @pytest.mark.unit
-def test_backup_storage_secret_reference():
+def test_backup_storage_secret_reference(values, path):
     """Test that backup storage references the correct secret."""
     secret_path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'percona', 'templates', 'minio-credentials-secret.yaml')
-    values_path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'percona', 'templates', 'percona-values.yaml')
     
     with open(secret_path, 'r', encoding='utf-8') as f:
         secret_content = f.read()
         secret_content = secret_content.replace('{{NAMESPACE}}', 'test')
         secret_content = secret_content.replace('{{AWS_ACCESS_KEY_ID}}', 'test')
         secret_content = secret_content.replace('{{AWS_SECRET_ACCESS_KEY}}', 'test')
-        secret = yaml.safe_load(secret_content)
-    
-    with open(values_path, 'r', encoding='utf-8') as f:
-        values_content = f.read()
-        values_content = values_content.replace('{{NODES}}', '3')
-        values = yaml.safe_load(values_content)
+        secret = yaml.load(secret_content, Loader=YAML_LOADER)
     
     secret_name = secret['metadata']['name']
     backup_secret_name = values['backup']['storages']['minio-backup']['s3']['credentialsSecret']
     
-    log_check("Backup config credentialsSecret matches secret metadata.name", backup_secret_name, secret_name, source=values_path)
+    log_check("Backup config credentialsSecret matches secret metadata.name", backup_secret_name, secret_name, source=path)
     assert secret_name == backup_secret_name, \
         f"Secret name {secret_name} must match backup config {backup_secret_name}"
 
 
 @pytest.mark.unit
-def test_backup_schedule_timezones():
+def test_backup_schedule_timezones(parsed_schedules, path, log):
     """Test that backup schedules use appropriate times (off-peak hours)."""
-    path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'percona', 'templates', 'percona-values.yaml')
-    with open(path, 'r', encoding='utf-8') as f:
-        content = f.read()
-        content = content.replace('{{NODES}}', '3')
-        values = yaml.safe_load(content)
-    
-    schedules = values['backup']['schedule']
-    
-    for schedule in schedules:
-        cron = parse_cron_schedule(schedule['schedule'])
-        hour = int(cron['hour'])
+    for schedule in parsed_schedules:
+        cron = schedule['cron']
+        assert cron, f"Invalid cron format: {schedule['schedule']}"
+        hour = cron['hour']
         
         # Backups should run during off-peak hours (1-3 AM)
-        log_check(f"Backup {schedule['name']} hour should be 1-3", "1..3", f"{hour}", source=path)
-        assert 1 <= hour <= 3, \
-            f"Backup {schedule['name']} should run during off-peak hours (1-3 AM), not {hour}:00"
+        log.check(f"Backup {schedule['name']} hour should be 1-3", "1..3", hour, source=path)
+        assert _OFFPEAK_HOUR.fullmatch(hour), \
+            f"Backup {schedule['name']} should run during off-peak hours (1-3 AM), not hour field '{hour}'"
 
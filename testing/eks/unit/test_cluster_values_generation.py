@@ -2,121 +2,110 @@
 Unit tests for cluster values generation logic.
 Tests the clusterValues function behavior by validating template substitution.
 """
-import os
 import yaml
 import pytest
-import re
-from conftest import log_check
+from conftest import log_check, VALUES_FILE, YAML_LOADER
+
+
+# Not a default size anywhere in the template, so a hardcoded size cannot pass by coincidence
+_BASE_NODES = 7
+
+
+def _substitute(template_text, node_count):
+    """Template with {{NODES}} replaced by node_count, and its parsed values."""
+    content = template_text.replace('{{NODES}}', str(node_count))
+    return content, yaml.load(content, Loader=YAML_LOADER)
+
+
+@pytest.fixture(scope="module")
+def substituted_template(template_text):
+    """Template substituted with _BASE_NODES, parsed once per module."""
+    return _substitute(template_text, _BASE_NODES)
+
+
+@pytest.fixture(scope="module", params=[3, 6, 9], ids=lambda n: f"template:{n}")
+def values_source(request, template_text):
+    """Cluster values parsed from the template substituted with one node count: (node_count, values)."""
+    node_count = request.param
+    return node_count, _substitute(template_text, node_count)[1]
 
 
 @pytest.mark.unit
-def test_cluster_values_template_substitution():
+def test_cluster_values_template_substitution(substituted_template):
     """Test that NODES placeholder is correctly substituted in template."""
-    template_path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'percona', 'templates', 'percona-values.yaml')
-    
-    with open(template_path, 'r', encoding='utf-8') as f:
-        template = f.read()
-    
-    # Simulate substitution for different node counts
-    for node_count in [3, 6, 9]:
-        content = template.replace('{{NODES}}', str(node_count))
-        values = yaml.safe_load(content)
-        
-        log_check(
-            criterion=f"pxc.size must equal substituted node_count={node_count}",
-            expected=f"{node_count}",
-            actual=f"{values['pxc']['size']}",
-            source=template_path,
-        )
-        assert values['pxc']['size'] == node_count
-        log_check(
-            criterion=f"proxysql.size must equal substituted node_count={node_count}",
-            expected=f"{node_count}",
-            actual=f"{values['proxysql']['size']}",
-            source=template_path,
-        )
-        assert values['proxysql']['size'] == node_count
-        log_check(
-            criterion="Template must not retain {{NODES}} placeholder after substitution",
-            expected="not present",
-            actual=f"present={ '{{NODES}}' in content }",
-            source=template_path,
-        )
-        assert '{{NODES}}' not in content, f"Template still contains {{NODES}} placeholder after substitution"
+    template_path = VALUES_FILE
+    content, values = substituted_template
+
+    log_check(
+        criterion=f"pxc.size must equal substituted node_count={_BASE_NODES}",
+        expected=lambda: f"{_BASE_NODES}",
+        actual=lambda: f"{values['pxc']['size']}",
+        source=template_path,
+    )
+    assert values['pxc']['size'] == _BASE_NODES
+    log_check(
+        criterion=f"proxysql.size must equal substituted node_count={_BASE_NODES}",
+        expected=lambda: f"{_BASE_NODES}",
+        actual=lambda: f"{values['proxysql']['size']}",
+        source=template_path,
+    )
+    assert values['proxysql']['size'] == _BASE_NODES
+    log_check(
+        criterion="Template must not retain {{NODES}} placeholder after substitution",
+        expected="not present",
+        actual=lambda: f"present={ '{{NODES}}' in content }",
+        source=template_path,
+    )
+    assert '{{NODES}}' not in content, f"Template still contains {{NODES}} placeholder after substitution"
 
 
 @pytest.mark.unit
-def test_cluster_values_yaml_validity():
+def test_cluster_values_yaml_validity(values_source):
     """Test that generated cluster values produce valid YAML."""
-    template_path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'percona', 'templates', 'percona-values.yaml')
-    
-    with open(template_path, 'r', encoding='utf-8') as f:
-        template = f.read()
-    
-    for node_count in [3, 6]:
-        content = template.replace('{{NODES}}', str(node_count))
-        # Should not raise exception
-        values = yaml.safe_load(content)
-        log_check(
-            criterion=f"Generated values for node_count={node_count} must be valid YAML",
-            expected="parsed object not None",
-            actual=f"is None={values is None}",
-            source=template_path,
-        )
-        assert values is not None
+    template_path = VALUES_FILE
+    # Parsing happened in the fixture and did not raise
+    node_count, values = values_source
+    log_check(
+        criterion=f"Generated values for node_count={node_count} must be valid YAML",
+        expected="parsed object not None",
+        actual=lambda: f"is None={values is None}",
+        source=template_path,
+    )
+    assert values is not None
 
 
 @pytest.mark.unit
-def test_cluster_values_node_count_consistency():
-    """Test that PXC and ProxySQL have matching node counts."""
-    template_path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'percona', 'templates', 'percona-values.yaml')
-    
-    with open(template_path, 'r', encoding='utf-8') as f:
-        template = f.read()
-    
-    for node_count in [3, 6, 9]:
-        content = template.replace('{{NODES}}', str(node_count))
-        values = yaml.safe_load(content)
-        
-        log_check(
-            criterion=f"pxc.size must equal proxysql.size for node_count={node_count}",
-            expected=f"{values['pxc']['size']}",
-            actual=f"{values['proxysql']['size']}",
-            source=template_path,
-        )
-        assert values['pxc']['size'] == values['proxysql']['size'], \
-            "PXC and ProxySQL node counts must match"
+def test_cluster_values_node_count_consistency(values_source):
+    """Test that PXC and ProxySQL both take the substituted node count."""
+    template_path = VALUES_FILE
+    node_count, values = values_source
+
+    log_check(
+        criterion=f"pxc.size and proxysql.size must both equal node_count={node_count}",
+        expected=lambda: f"{node_count}, {node_count}",
+        actual=lambda: f"{values['pxc']['size']}, {values['proxysql']['size']}",
+        source=template_path,
+    )
+    assert values['pxc']['size'] == values['proxysql']['size'] == node_count, \
+        "PXC and ProxySQL node counts must match the substituted node count"
 
 
 @pytest.mark.unit
-def test_cluster_values_minimum_nodes():
+def test_cluster_values_minimum_nodes(values_source):
     """Test that minimum 3 nodes are enforced (Percona best practice)."""
-    template_path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'percona', 'templates', 'percona-values.yaml')
-    
-    with open(template_path, 'r', encoding='utf-8') as f:
-        template = f.read()
-    
-    # Test with minimum recommended nodes
-    content = template.replace('{{NODES}}', '3')
-    values = yaml.safe_load(content)
+    template_path = VALUES_FILE
+    _, values = values_source
     
-    log_check("pxc.size must be >= 3", ">= 3", f"{values['pxc']['size']}", source=template_path)
+    log_check("pxc.size must be >= 3", ">= 3", lambda: f"{values['pxc']['size']}", source=template_path)
     assert values['pxc']['size'] >= 3, "Percona requires minimum 3 nodes for high availability"
-    log_check("proxysql.size must be >= 3", ">= 3", f"{values['proxysql']['size']}", source=template_path)
+    log_check("proxysql.size must be >= 3", ">= 3", lambda: f"{values['proxysql']['size']}", source=template_path)
     assert values['proxysql']['size'] >= 3, "ProxySQL requires minimum 3 nodes for high availability"
 
 
 @pytest.mark.unit
-def test_cluster_values_odd_node_count_preference():
+def test_cluster_values_odd_node_count_preference(values_source):
     """Test that odd node counts are preferred for quorum (best practice)."""
-    template_path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'percona', 'templates', 'percona-values.yaml')
-    
-    with open(template_path, 'r', encoding='utf-8') as f:
-        template = f.read()
-    
-    # Test with odd node count (recommended)
-    content = template.replace('{{NODES}}', '3')
-    values = yaml.safe_load(content)
+    _, values = values_source
     
     node_count = values['pxc']['size']
     # While not enforced, odd numbers are preferred for quorum
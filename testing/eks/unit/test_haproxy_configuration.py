@@ -2,21 +2,21 @@
 Unit tests for HAProxy configuration in Percona values.
 Run by default (HAProxy-first environments). If --proxysql is set, these tests are skipped.
 """
-import os
 import pytest
 from conftest import log_check, TOPOLOGY_KEY
 
+# Zone-level keys (current and legacy label); hostname spreading is also accepted when
+# TOPOLOGY_KEY asks for it
+_ZONE_KEYS = frozenset(('topology.kubernetes.io/zone', 'failure-domain.beta.kubernetes.io/zone'))
+_ZONE_OR_HOST_KEYS = _ZONE_KEYS | {'kubernetes.io/hostname'}
+_ACCEPTED_TOPOLOGY_KEYS = _ZONE_OR_HOST_KEYS if TOPOLOGY_KEY == 'kubernetes.io/hostname' else _ZONE_KEYS
+
 
 @pytest.mark.unit
-def test_haproxy_enabled(is_proxysql, values_norm):
+def test_haproxy_enabled(is_proxysql, values, path):
     if is_proxysql:
         pytest.skip("Skipping HAProxy tests when --proxysql is set")
 
-    path = os.path.join(os.getcwd(), '..', '..', 'percona', 'templates', 'percona-values.yaml')
-    with open(path, 'r', encoding='utf-8') as f:
-        import yaml
-        values = yaml.safe_load(f.read().replace('{{NODES}}', '3'))
-
     haproxy = values.get('haproxy', {})
     if not isinstance(haproxy, dict) or haproxy.get('enabled') is not True:
         pytest.skip("HAProxy not enabled in this environment")
@@ -25,15 +25,10 @@ def test_haproxy_enabled(is_proxysql, values_norm):
 
 
 @pytest.mark.unit
-def test_haproxy_pdb_and_affinity_if_present(is_proxysql):
+def test_haproxy_pdb_and_affinity_if_present(is_proxysql, values, path):
     if is_proxysql:
         pytest.skip("Skipping HAProxy tests when --proxysql is set")
 
-    path = os.path.join(os.getcwd(), '..', '..', 'percona', 'templates', 'percona-values.yaml')
-    with open(path, 'r', encoding='utf-8') as f:
-        import yaml
-        values = yaml.safe_load(f.read().replace('{{NODES}}', '3'))
-
     haproxy = values.get('haproxy', {})
     if not isinstance(haproxy, dict) or haproxy.get('enabled') is not True:
         pytest.skip("HAProxy not enabled; skipping HAProxy-specific checks")
@@ -50,24 +45,16 @@ def test_haproxy_pdb_and_affinity_if_present(is_proxysql):
     affinity = (haproxy.get('affinity') or {}).get('podAntiAffinity', {})
     required = affinity.get('requiredDuringSchedulingIgnoredDuringExecution', [])
     if required:
-        accepted_keys = ['topology.kubernetes.io/zone', 'failure-domain.beta.kubernetes.io/zone']
-        if TOPOLOGY_KEY == 'kubernetes.io/hostname':
-            accepted_keys = ['kubernetes.io/hostname', 'topology.kubernetes.io/zone', 'failure-domain.beta.kubernetes.io/zone']
-        topo_found = any((r.get('topologyKey') in accepted_keys) for r in required)
-        log_check("HAProxy anti-affinity uses required topology key", f"in {accepted_keys}", f"found={topo_found}", source=path)
+        topo_found = any(r.get('topologyKey') in _ACCEPTED_TOPOLOGY_KEYS for r in required)
+        log_check("HAProxy anti-affinity uses required topology key", lambda: f"in {sorted(_ACCEPTED_TOPOLOGY_KEYS)}", f"found={topo_found}", source=path)
         assert topo_found
 
 
 @pytest.mark.unit
-def test_haproxy_resources_if_present(is_proxysql):
+def test_haproxy_resources_if_present(is_proxysql, values, path):
     if is_proxysql:
         pytest.skip("Skipping HAProxy tests when --proxysql is set")
 
-    path = os.path.join(os.getcwd(), '..', '..', 'percona', 'templates', 'percona-values.yaml')
-    with open(path, 'r', encoding='utf-8') as f:
-        import yaml
-        values = yaml.safe_load(f.read().replace('{{NODES}}', '3'))
-
     haproxy = values.get('haproxy', {})
     if not isinstance(haproxy, dict) or haproxy.get('enabled') is not True:
         pytest.skip("HAProxy not enabled; skipping HAProxy-specific checks")
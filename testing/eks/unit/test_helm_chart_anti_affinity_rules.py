@@ -3,33 +3,17 @@ Test that Helm chart includes anti-affinity rules in PerconaXtraDBCluster spec
 (operator will apply these to StatefulSets)
 """
 import pytest
-import subprocess
-import yaml
-from conftest import TEST_NAMESPACE, TEST_CLUSTER_NAME, TEST_EXPECTED_NODES
 from conftest import log_check
 
 @pytest.mark.unit
-def test_helm_chart_anti_affinity_rules(chartmuseum_port_forward):
+def test_helm_chart_anti_affinity_rules(helm_rendered):
     """Test that Helm chart includes anti-affinity rules in PerconaXtraDBCluster spec
     (operator will apply these to StatefulSets)"""
-    # chartmuseum_port_forward fixture handles repo setup
-    
-    result = subprocess.run(
-        ['helm', 'template', 'test-chart', 'internal/pxc-db', '--namespace', TEST_NAMESPACE],
-        capture_output=True,
-        text=True,
-        timeout=30
-    )
-
-    # Check if chart is available (skip if ChartMuseum not accessible)
-    if result.returncode != 0:
-        pytest.skip(f"Local ChartMuseum chart not available: {result.stderr}")
+    # helm_rendered renders the chart once per session (skipped if ChartMuseum is not accessible)
 
     # Check for affinity in PerconaXtraDBCluster CR spec
-    manifests = list(yaml.safe_load_all(result.stdout))
-
     cr = next(
-        (m for m in manifests if m.get('kind') == 'PerconaXtraDBCluster'),
+        (m for m in helm_rendered.manifests if m.get('kind') == 'PerconaXtraDBCluster'),
         None
     )
 
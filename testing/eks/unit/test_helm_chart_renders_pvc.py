@@ -3,35 +3,20 @@ Test that Helm chart includes PVC configuration in PerconaXtraDBCluster spec
 (operator will create PVCs from volumeSpec)
 """
 import pytest
-import subprocess
-import yaml
-from conftest import TEST_NAMESPACE, TEST_CLUSTER_NAME, TEST_EXPECTED_NODES
 from conftest import log_check
 from rich.console import Console
 
 console = Console()
 
 @pytest.mark.unit
-def test_helm_chart_renders_pvc(chartmuseum_port_forward):
+def test_helm_chart_renders_pvc(helm_rendered):
     """Test that Helm chart includes PVC configuration in PerconaXtraDBCluster spec
     (operator will create PVCs from volumeSpec)"""
-    # chartmuseum_port_forward fixture handles repo setup
-    
-    result = subprocess.run(
-        ['helm', 'template', 'test-chart', 'internal/pxc-db', '--namespace', TEST_NAMESPACE],
-        capture_output=True,
-        text=True,
-        timeout=30
-    )
-
-    # Check if chart is available (skip if ChartMuseum not accessible)
-    if result.returncode != 0:
-        pytest.skip(f"Local ChartMuseum chart not available: {result.stderr}")
+    # helm_rendered renders the chart once per session (skipped if ChartMuseum is not accessible)
 
     # Helm chart includes volumeSpec in the CR, operator creates PVCs
-    manifests = list(yaml.safe_load_all(result.stdout))
     cr = next(
-        (m for m in manifests if m.get('kind') == 'PerconaXtraDBCluster'),
+        (m for m in helm_rendered.manifests if m.get('kind') == 'PerconaXtraDBCluster'),
         None
     )
 
@@ -3,46 +3,29 @@ Test that Helm chart renders PerconaXtraDBCluster custom resource
 (operator will create StatefulSets from this CR)
 """
 import pytest
-import subprocess
-import yaml
-from conftest import TEST_NAMESPACE, TEST_CLUSTER_NAME, TEST_EXPECTED_NODES
 from conftest import log_check
 from rich.console import Console
 
 console = Console()
 
 @pytest.mark.unit
-def test_helm_chart_renders_statefulset(chartmuseum_port_forward):
+def test_helm_chart_renders_statefulset(helm_rendered):
     """Test that Helm chart renders PerconaXtraDBCluster custom resource 
     (operator will create StatefulSets from this CR)"""
-    # chartmuseum_port_forward fixture handles repo setup
-    
-    result = subprocess.run(
-        ['helm', 'template', 'test-chart', 'internal/pxc-db', '--namespace', TEST_NAMESPACE],
-        capture_output=True,
-        text=True,
-        timeout=30
-    )
-
-    # Check if chart is available (skip if ChartMuseum not accessible)
-    if result.returncode != 0:
-        pytest.skip(f"Local ChartMuseum chart not available: {result.stderr}")
+    # helm_rendered renders the chart once per session (skipped if ChartMuseum is not accessible)
     
     # Helm chart renders PerconaXtraDBCluster CR, not StatefulSets directly
     # The operator creates StatefulSets from the CR
     log_check(
         criterion="Helm render should include PerconaXtraDBCluster custom resource",
         expected="PerconaXtraDBCluster present in output",
-        actual=f"present={'PerconaXtraDBCluster' in result.stdout}",
+        actual=f"present={'PerconaXtraDBCluster' in helm_rendered.stdout}",
         source="helm template internal/pxc-db",
     )
-    assert 'PerconaXtraDBCluster' in result.stdout, "Helm chart should render PerconaXtraDBCluster custom resource"
+    assert 'PerconaXtraDBCluster' in helm_rendered.stdout, "Helm chart should render PerconaXtraDBCluster custom resource"
 
     # Parse and verify PerconaXtraDBCluster CR
-    manifests = []
-    for doc in yaml.safe_load_all(result.stdout):
-        if doc and doc.get('kind') == 'PerconaXtraDBCluster':
-            manifests.append(doc)
+    manifests = [doc for doc in helm_rendered.manifests if doc.get('kind') == 'PerconaXtraDBCluster']
 
     log_check(
         criterion="At least one PerconaXtraDBCluster CR must be rendered",
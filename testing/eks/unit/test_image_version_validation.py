@@ -2,22 +2,17 @@
 Unit tests for container image version validation.
 Validates that image versions match Percona Operator v1.18 recommendations.
 """
-import os
-import yaml
 import pytest
 import re
 from conftest import log_check
 
+# Leading MAJOR.MINOR.PATCH of an image tag, e.g. 2.7.3 in 2.7.3-1
+_SEMVER_RE = re.compile(r'^(\d+)\.(\d+)\.(\d+)')
+
 
 @pytest.mark.unit
-def test_proxysql_image_version():
+def test_proxysql_image_version(values, path):
     """Test that ProxySQL image version is specified and valid."""
-    path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'percona', 'templates', 'percona-values.yaml')
-    with open(path, 'r', encoding='utf-8') as f:
-        content = f.read()
-        content = content.replace('{{NODES}}', '3')
-        values = yaml.safe_load(content)
-    
     proxysql = values['proxysql']
     log_check(
         criterion="ProxySQL image must be specified in values",
@@ -48,14 +43,8 @@ def test_proxysql_image_version():
 
 
 @pytest.mark.unit
-def test_proxysql_image_version_pinned():
+def test_proxysql_image_version_pinned(values, path):
     """Test that ProxySQL image version is pinned (not 'latest')."""
-    path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'percona', 'templates', 'percona-values.yaml')
-    with open(path, 'r', encoding='utf-8') as f:
-        content = f.read()
-        content = content.replace('{{NODES}}', '3')
-        values = yaml.safe_load(content)
-    
     image = values['proxysql']['image']
     image_tag = image.split(':')[1]
     
@@ -63,26 +52,19 @@ def test_proxysql_image_version_pinned():
     assert image_tag != 'latest', "Image tag must not be 'latest' - use specific version for stability"
     
     # Version should be in format like 2.7.3 or 2.x.x
-    version_pattern = r'^\d+\.\d+\.\d+'
-    log_check("Image tag should be semantic version (e.g., 2.7.3)", version_pattern, f"{image_tag}", source=path)
-    assert re.match(version_pattern, image_tag), \
+    log_check("Image tag should be semantic version (e.g., 2.7.3)", _SEMVER_RE.pattern, f"{image_tag}", source=path)
+    assert _SEMVER_RE.match(image_tag), \
         f"Image tag should be a version number, not '{image_tag}'"
 
 
 @pytest.mark.unit
-def test_proxysql_image_compatibility():
+def test_proxysql_image_compatibility(values, path):
     """Test that ProxySQL image version is compatible with Percona Operator v1.18."""
-    path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'percona', 'templates', 'percona-values.yaml')
-    with open(path, 'r', encoding='utf-8') as f:
-        content = f.read()
-        content = content.replace('{{NODES}}', '3')
-        values = yaml.safe_load(content)
-    
     image = values['proxysql']['image']
     image_tag = image.split(':')[1]
     
     # Extract version numbers
-    version_match = re.match(r'^(\d+)\.(\d+)\.(\d+)', image_tag)
+    version_match = _SEMVER_RE.match(image_tag)
     if version_match:
         major, minor, patch = map(int, version_match.groups())
         
@@ -94,14 +76,8 @@ def test_proxysql_image_compatibility():
 
 
 @pytest.mark.unit
-def test_pxc_image_version_uses_operator_default():
+def test_pxc_image_version_uses_operator_default(values, path):
     """Test that PXC image version uses operator defaults (best practice)."""
-    path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'percona', 'templates', 'percona-values.yaml')
-    with open(path, 'r', encoding='utf-8') as f:
-        content = f.read()
-        content = content.replace('{{NODES}}', '3')
-        values = yaml.safe_load(content)
-    
     pxc = values['pxc']
     
     # PXC image should use operator default (operator manages version)
@@ -120,14 +96,8 @@ def test_pxc_image_version_uses_operator_default():
 
 
 @pytest.mark.unit
-def test_image_registry_configured():
+def test_image_registry_configured(values, path):
     """Test that images use appropriate registry (percona registry preferred)."""
-    path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'percona', 'templates', 'percona-values.yaml')
-    with open(path, 'r', encoding='utf-8') as f:
-        content = f.read()
-        content = content.replace('{{NODES}}', '3')
-        values = yaml.safe_load(content)
-    
     # ProxySQL should use percona registry or official registry
     proxysql_image = values['proxysql']['image']
     
@@ -141,18 +111,12 @@ def test_image_registry_configured():
 
 
 @pytest.mark.unit
-def test_image_pull_policy_not_always():
+def test_image_pull_policy_not_always(values, path):
     """Test that image pull policy is not 'Always' (security best practice)."""
     # Note: This test documents best practice
     # Percona Operator typically uses IfNotPresent or the operator's default
     # 'Always' is not recommended for production as it can cause unnecessary pulls
     
-    path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'percona', 'templates', 'percona-values.yaml')
-    with open(path, 'r', encoding='utf-8') as f:
-        content = f.read()
-        content = content.replace('{{NODES}}', '3')
-        values = yaml.safe_load(content)
-    
     # Check if imagePullPolicy is specified anywhere
     # If specified, it should not be 'Always' for production workloads
     
@@ -56,9 +56,8 @@ def test_percona_values_pxc_configuration():
 
 
 @pytest.mark.unit
-def test_percona_values_proxysql_configuration(request):
-    if not request.config.getoption('--proxysql'):
-        pytest.skip("ProxySQL tests run only with --proxysql")
+@pytest.mark.proxysql
+def test_percona_values_proxysql_configuration():
     """Test ProxySQL configuration matches expected values."""
     path = os.path.join(os.getcwd(), '..', '..', 'percona', 'templates', 'percona-values.yaml')
     with open(path, 'r', encoding='utf-8') as f:
@@ -95,9 +94,8 @@ def test_percona_values_proxysql_configuration(request):
 
 
 @pytest.mark.unit
-def test_percona_values_haproxy_disabled(request):
-    if not request.config.getoption('--proxysql'):
-        pytest.skip("This HAProxy-disabled test is only relevant when ProxySQL is enabled")
+@pytest.mark.proxysql
+def test_percona_values_haproxy_disabled():
     """Test that HAProxy is disabled."""
     path = os.path.join(os.getcwd(), '..', '..', 'percona', 'templates', 'percona-values.yaml')
     with open(path, 'r', encoding='utf-8') as f:
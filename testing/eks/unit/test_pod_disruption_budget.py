@@ -123,35 +123,27 @@ def test_pdb_allows_rolling_updates():
 
 
 @pytest.mark.unit
-def test_pdb_maintains_quorum():
+@pytest.mark.parametrize("node_count", [3, 5, 7])
+def test_pdb_maintains_quorum(values, path, node_count):
     """Test that PDB settings maintain quorum for PXC cluster."""
-    path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'percona', 'templates', 'percona-values.yaml')
+    # The PDB does not depend on {{NODES}}, so every node count shares the session parse
+    pdb = values['pxc']['podDisruptionBudget']
+    max_unavailable = pdb.get('maxUnavailable', 0)
     
-    # Test with different node counts
-    for node_count in [3, 5, 7]:
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            content = content.replace('{{NODES}}', str(node_count))
-            values = yaml.safe_load(content)
-        
-        pdb = values['pxc']['podDisruptionBudget']
-        max_unavailable = pdb.get('maxUnavailable', 0)
-        
-        # For quorum: (n/2) + 1 nodes must be available
-        # With maxUnavailable=1, for 3-node: 2 available (quorum OK)
-        # For 5-node: 4 available (quorum OK)
-        # For 7-node: 6 available (quorum OK)
-        available_during_disruption = node_count - max_unavailable
-        
-        # Quorum = floor(n/2) + 1
-        quorum = (node_count // 2) + 1
-        
-        log_check(
-            criterion=f"For {node_count}-node cluster, available during disruption must be >= quorum {quorum}",
-            expected=f">= {quorum}",
-            actual=f"available_during_disruption = {available_during_disruption} (maxUnavailable={max_unavailable})",
-            source=path,
-        )
-        assert available_during_disruption >= quorum, \
-            f"For {node_count}-node cluster, maxUnavailable={max_unavailable} must maintain quorum of {quorum}"
-
+    # For quorum: (n/2) + 1 nodes must be available
+    # With maxUnavailable=1, for 3-node: 2 available (quorum OK)
+    # For 5-node: 4 available (quorum OK)
+    # For 7-node: 6 available (quorum OK)
+    available_during_disruption = node_count - max_unavailable
+    
+    # Quorum = floor(n/2) + 1
+    quorum = (node_count // 2) + 1
+    
+    log_check(
+        criterion=f"For {node_count}-node cluster, available during disruption must be >= quorum {quorum}",
+        expected=f">= {quorum}",
+        actual=f"available_during_disruption = {available_during_disruption} (maxUnavailable={max_unavailable})",
+        source=path,
+    )
+    assert available_during_disruption >= quorum, \
+        f"For {node_count}-node cluster, maxUnavailable={max_unavailable} must maintain quorum of {quorum}"
@@ -3,9 +3,8 @@ Unit test for Percona XtraDB Cluster updateStrategy validation.
 Validates that the updateStrategy is set to SmartUpdate in the PerconaXtraDBCluster CR.
 """
 import os
-import yaml
 import pytest
-from conftest import log_check, FLEET_RENDERED_MANIFEST
+from conftest import log_check, find_manifest_doc, FLEET_RENDERED_MANIFEST
 
 
 @pytest.mark.unit
@@ -53,15 +52,7 @@ def test_update_strategy_is_smart_update():
     if not FLEET_RENDERED_MANIFEST or not os.path.exists(FLEET_RENDERED_MANIFEST):
         pytest.skip("Fleet rendered manifest not available")
     
-    with open(FLEET_RENDERED_MANIFEST, 'r', encoding='utf-8') as f:
-        docs = list(yaml.safe_load_all(f))
-    
-    # Find the PerconaXtraDBCluster custom resource
-    pxc_cluster = None
-    for doc in docs:
-        if doc and doc.get('kind') == 'PerconaXtraDBCluster':
-            pxc_cluster = doc
-            break
+    pxc_cluster = find_manifest_doc('PerconaXtraDBCluster')
     
     if not pxc_cluster:
         pytest.skip("PerconaXtraDBCluster resource not found in rendered manifest")
@@ -103,15 +94,7 @@ def test_update_strategy_is_valid():
     if not FLEET_RENDERED_MANIFEST or not os.path.exists(FLEET_RENDERED_MANIFEST):
         pytest.skip("Fleet rendered manifest not available")
     
-    with open(FLEET_RENDERED_MANIFEST, 'r', encoding='utf-8') as f:
-        docs = list(yaml.safe_load_all(f))
-    
-    # Find the PerconaXtraDBCluster custom resource
-    pxc_cluster = None
-    for doc in docs:
-        if doc and doc.get('kind') == 'PerconaXtraDBCluster':
-            pxc_cluster = doc
-            break
+    pxc_cluster = find_manifest_doc('PerconaXtraDBCluster')
     
     if not pxc_cluster:
         pytest.skip("PerconaXtraDBCluster resource not found in rendered manifest")
@@ -138,15 +121,7 @@ def test_pxc_cluster_has_required_fields():
     if not FLEET_RENDERED_MANIFEST or not os.path.exists(FLEET_RENDERED_MANIFEST):
         pytest.skip("Fleet rendered manifest not available")
     
-    with open(FLEET_RENDERED_MANIFEST, 'r', encoding='utf-8') as f:
-        docs = list(yaml.safe_load_all(f))
-    
-    # Find the PerconaXtraDBCluster custom resource
-    pxc_cluster = None
-    for doc in docs:
-        if doc and doc.get('kind') == 'PerconaXtraDBCluster':
-            pxc_cluster = doc
-            break
+    pxc_cluster = find_manifest_doc('PerconaXtraDBCluster')
     
     if not pxc_cluster:
         pytest.skip("PerconaXtraDBCluster resource not found in rendered manifest")
@@ -159,59 +159,58 @@ def test_statefulset_service_name_matches(chartmuseum_port_forward):
 
 
 @pytest.mark.unit
-def test_statefulset_replicas_match_cluster_size(chartmuseum_port_forward):
+@pytest.mark.parametrize("node_count", [3, 6])
+def test_statefulset_replicas_match_cluster_size(chartmuseum_port_forward, node_count):
     """Test that StatefulSet replicas match the configured cluster size."""
     # chartmuseum_port_forward fixture handles repo setup
     
     path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'percona', 'templates', 'percona-values.yaml')
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+        content = content.replace('{{NODES}}', str(node_count))
+        values = yaml.safe_load(content)
+    
+    # Values should specify size
+    log_check("pxc.size must equal configured cluster size", f"{node_count}", f"{values['pxc']['size']}", source=path)
+    assert values['pxc']['size'] == node_count
+    log_check("proxysql.size must equal configured cluster size", f"{node_count}", f"{values['proxysql']['size']}", source=path)
+    assert values['proxysql']['size'] == node_count
+    
+    # Helm should render StatefulSets with matching replicas
+    result = subprocess.run(
+        ['helm', 'template', 'test', 'internal/pxc-db', 
+         '--namespace', 'test', '--set', f'pxc.size={node_count}', 
+         '--set', f'proxysql.size={node_count}'],
+        capture_output=True,
+        text=True,
+        timeout=30
+    )
     
-    for node_count in [3, 6]:
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            content = content.replace('{{NODES}}', str(node_count))
-            values = yaml.safe_load(content)
-        
-        # Values should specify size
-        log_check("pxc.size must equal configured cluster size", f"{node_count}", f"{values['pxc']['size']}", source=path)
-        assert values['pxc']['size'] == node_count
-        log_check("proxysql.size must equal configured cluster size", f"{node_count}", f"{values['proxysql']['size']}", source=path)
-        assert values['proxysql']['size'] == node_count
-        
-        # Helm should render StatefulSets with matching replicas
-        result = subprocess.run(
-            ['helm', 'template', 'test', 'internal/pxc-db', 
-             '--namespace', 'test', '--set', f'pxc.size={node_count}', 
-             '--set', f'proxysql.size={node_count}'],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        
-        if result.returncode != 0:
-            pytest.skip(f"Local ChartMuseum chart not available: {result.stderr}")
-        
-        for doc in yaml.safe_load_all(result.stdout):
-            if doc and doc.get('kind') == 'StatefulSet':
-                labels = doc.get('metadata', {}).get('labels', {})
-                replicas = doc.get('spec', {}).get('replicas')
-                
-                if labels.get('app.kubernetes.io/component') == 'pxc' and replicas is not None:
-                    log_check(
-                        criterion="PXC StatefulSet replicas must match cluster size",
-                        expected=f"{node_count}",
-                        actual=f"{replicas}",
-                        source="helm template internal/pxc-db",
-                    )
-                    assert replicas == node_count, \
-                        f"PXC StatefulSet replicas {replicas} should match cluster size {node_count}"
-                
-                elif labels.get('app.kubernetes.io/component') == 'proxysql' and replicas is not None:
-                    log_check(
-                        criterion="ProxySQL StatefulSet replicas must match cluster size",
-                        expected=f"{node_count}",
-                        actual=f"{replicas}",
-                        source="helm template internal/pxc-db",
-                    )
-                    assert replicas == node_count, \
-                        f"ProxySQL StatefulSet replicas {replicas} should match cluster size {node_count}"
+    if result.returncode != 0:
+        pytest.skip(f"Local ChartMuseum chart not available: {result.stderr}")
+    
+    for doc in yaml.safe_load_all(result.stdout):
+        if doc and doc.get('kind') == 'StatefulSet':
+            labels = doc.get('metadata', {}).get('labels', {})
+            replicas = doc.get('spec', {}).get('replicas')
+            
+            if labels.get('app.kubernetes.io/component') == 'pxc' and replicas is not None:
+                log_check(
+                    criterion="PXC StatefulSet replicas must match cluster size",
+                    expected=f"{node_count}",
+                    actual=f"{replicas}",
+                    source="helm template internal/pxc-db",
+                )
+                assert replicas == node_count, \
+                    f"PXC StatefulSet replicas {replicas} should match cluster size {node_count}"
+            
+            elif labels.get('app.kubernetes.io/component') == 'proxysql' and replicas is not None:
+                log_check(
+                    criterion="ProxySQL StatefulSet replicas must match cluster size",
+                    expected=f"{node_count}",
+                    actual=f"{replicas}",
+                    source="helm template internal/pxc-db",
+                )
+                assert replicas == node_count, \
+                    f"ProxySQL StatefulSet replicas {replicas} should match cluster size {node_count}"
 
@@ -1,13 +1,19 @@
 """
 Pytest configuration and shared fixtures for Percona XtraDB Cluster tests
 """
+import functools
+import glob
+import hashlib
 import os
-import inspect
+import re
 import subprocess
+import sys
 import json
+import threading
 import warnings
+from collections import namedtuple
 import pytest
-from kubernetes import client, config
+import yaml
 from rich.console import Console
 
 # Suppress urllib3 warnings about OpenSSL
@@ -36,6 +42,13 @@ def pytest_addoption(parser):
         default=False,
         help='Trigger chaos experiments before running resiliency tests'
     )
+    parser.addoption(
+        '--use-k8s-cache',
+        action='store_true',
+        default=False,
+        help='Serve repeated read-only Kubernetes API GETs from an on-disk cache (local dev loops; '
+             'ignored when resiliency/DR tests are selected)'
+    )
 
 # Pytest markers for test categorization
 pytest_plugins = []
@@ -49,6 +62,8 @@ TEST_BACKUP_BUCKET = os.getenv('TEST_BACKUP_BUCKET', '')
 TEST_OPERATOR_NAMESPACE = os.getenv('TEST_OPERATOR_NAMESPACE', TEST_NAMESPACE)
 MINIO_NAMESPACE = os.getenv('MINIO_NAMESPACE', 'minio')
 CHAOS_NAMESPACE = os.getenv('CHAOS_NAMESPACE', 'litmus')
+# Comma-separated namespaces, each with its own PXC cluster, that `pytest -n N -m dr` spreads DR tests across
+DR_NAMESPACES = [ns.strip() for ns in os.getenv('DR_NAMESPACES', '').split(',') if ns.strip()]
 ON_PREM = True  # On-prem test suite always uses on-prem mode
 STORAGE_CLASS_NAME = os.getenv('STORAGE_CLASS_NAME', 'standard')  # On-prem default
 TOPOLOGY_KEY = os.getenv('TOPOLOGY_KEY', 'kubernetes.io/hostname')  # On-prem default
@@ -66,6 +81,14 @@ BACKUP_PATH = os.getenv('BACKUP_PATH', '')          # e.g., 'pxc-db.backup'
 
 # Fleet rendered manifest (on-prem mode with Fleet)
 FLEET_RENDERED_MANIFEST = os.getenv('FLEET_RENDERED_MANIFEST', '')
+# Resolved once at import; used as the values cache key
+_FLEET_MANIFEST_REAL = os.path.realpath(FLEET_RENDERED_MANIFEST) if FLEET_RENDERED_MANIFEST else ''
+_VALUES_FILE_REAL = os.path.realpath(VALUES_FILE) if VALUES_FILE else ''
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+if not yaml.__with_libyaml__:
+    warnings.warn("PyYAML was built without libyaml; values parsing uses the slower pure-Python loader")
 
 
 def _deep_get(obj, path: str):
@@ -94,21 +117,86 @@ def _auto_locate(obj: dict, candidates: list[str]) -> dict | None:
     return None
 
 
+# orjson is optional; it only speeds up the JSON sidecar cache below
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(value) -> bytes:
+        return json.dumps(value).encode('utf-8')
+    _json_loads = json.loads
+
+# Parsed YAML keyed by (path, sha256 of the parsed text) so each file is parsed once per session
+_YAML_CACHE = {}
+
+
+def _cached_yaml(path: str, parse, preprocess=None, persist=True):
+    """
+    Return parse(text) for path, re-parsing only when the text changes.
+
+    Parsed results are also written to a `<path>.<sha256>.json` sidecar so
+    warm reruns decode JSON (with orjson when installed) instead of YAML;
+    stale sidecars are removed. Pass persist=False for per-run files (such as
+    the Fleet-rendered manifest) whose path never repeats.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    if preprocess:
+        text = preprocess(text)
+    sha = hashlib.sha256(text.encode('utf-8')).hexdigest()
+    key = (path, sha)
+    if key in _YAML_CACHE:
+        return _YAML_CACHE[key]
+    if not persist:
+        _YAML_CACHE[key] = parse(text)
+        return _YAML_CACHE[key]
+
+    sidecar = f"{path}.{sha}.json"
+    try:
+        with open(sidecar, 'rb') as f:
+            _YAML_CACHE[key] = _json_loads(f.read())
+        return _YAML_CACHE[key]
+    except (OSError, ValueError):
+        pass
+
+    value = parse(text)
+    _YAML_CACHE[key] = value
+    try:
+        dumped = _json_dumps(value)
+        # Only cache YAML that survives a JSON round trip (no dates, non-string keys, ...)
+        if _json_loads(dumped) == value:
+            for stale in glob.glob(f"{glob.escape(path)}.*.json"):
+                if stale != sidecar:
+                    os.remove(stale)
+            # Write then rename so parallel (xdist) workers never read a partial sidecar
+            tmp = f"{sidecar}.{os.getpid()}.tmp"
+            with open(tmp, 'wb') as f:
+                f.write(dumped)
+            os.replace(tmp, sidecar)
+    except (OSError, TypeError, ValueError):
+        pass
+    return value
+
+
 def _load_values_yaml() -> dict:
     # On-prem always uses Fleet rendered manifest
     if FLEET_RENDERED_MANIFEST and os.path.exists(FLEET_RENDERED_MANIFEST):
         try:
-            import yaml
-            with open(FLEET_RENDERED_MANIFEST, 'r', encoding='utf-8') as f:
-                # Load all documents from the manifest
-                docs = list(yaml.safe_load_all(f))
-                # For now, return the first PerconaXtraDBCluster CR if found
-                for doc in docs:
-                    if doc and doc.get('kind') == 'PerconaXtraDBCluster':
-                        # Extract the spec which contains pxc, proxysql, etc.
-                        return doc.get('spec', {})
-                # If no PXC CR found, return empty
-                return {}
+            # Load all documents from the manifest
+            # run_tests.sh renders a fresh timestamped file every run, so a sidecar would never hit
+            docs = _cached_yaml(
+                FLEET_RENDERED_MANIFEST,
+                lambda text: list(yaml.load_all(text, Loader=YAML_LOADER)),
+                persist=False,
+            )
+            # For now, return the first PerconaXtraDBCluster CR if found
+            for doc in docs:
+                if doc and doc.get('kind') == 'PerconaXtraDBCluster':
+                    # Extract the spec which contains pxc, proxysql, etc.
+                    return doc.get('spec', {})
+            # If no PXC CR found, return empty
+            return {}
         except Exception as e:
             console.print(f"[yellow]⚠ Warning: Failed to load Fleet manifest: {e}[/yellow]")
             return {}
@@ -161,30 +249,179 @@ def values_norm():
     return get_normalized_values()
 
 
+def _load_raw_values_file() -> dict:
+    return _cached_yaml(
+        VALUES_FILE,
+        lambda text: yaml.load(text, Loader=YAML_LOADER) or {},
+        preprocess=lambda content: content.replace('{{NODES}}', '3'),
+    )
+
+
+# Keyed by (realpath, mtime) so repeat calls skip the read and hash; bounded for long watch sessions
+@functools.lru_cache(maxsize=8)
+def _values_for_key(real_path: str, mtime_ns: int, load, path: str):
+    return load(), path
+
+
 def get_values_for_test():
     """
     Get values for unit tests, preferring Fleet-rendered manifest over raw values file.
     Returns (values_dict, source_path) tuple.
+    The same tuple is returned until the source file changes; treat it as read-only.
     """
     if FLEET_RENDERED_MANIFEST and os.path.exists(FLEET_RENDERED_MANIFEST):
         # Use Fleet-rendered manifest
-        raw = _load_values_yaml()  # This will extract from rendered manifest
-        return (raw, FLEET_RENDERED_MANIFEST)
+        path, real = FLEET_RENDERED_MANIFEST, _FLEET_MANIFEST_REAL
+        load = _load_values_yaml  # This will extract from rendered manifest
     else:
         # Use raw values file
-        path = VALUES_FILE
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        content = content.replace('{{NODES}}', '3')
-        import yaml
-        values = yaml.safe_load(content) or {}
-        return (values, path)
+        path, real = VALUES_FILE, _VALUES_FILE_REAL
+        load = _load_raw_values_file
+    return _values_for_key(real, os.stat(path).st_mtime_ns, load, path)
 
 
-def log_check(criterion: str, expected: str, actual: str, source: str = ""):
+def flatten_values(obj, prefix: tuple = ()) -> dict:
+    """
+    Flatten parsed values into {key_path_tuple: value} for single-lookup access.
+    List items are keyed by index, e.g. ('pxc', 'affinity', 'podAntiAffinity',
+    'requiredDuringSchedulingIgnoredDuringExecution', 0, 'topologyKey').
+    Intermediate dicts/lists are kept too, so subtree lookups also work.
+    """
+    flat = {}
+    if isinstance(obj, dict):
+        items = obj.items()
+    elif isinstance(obj, list):
+        items = enumerate(obj)
+    else:
+        return flat
+    for key, val in items:
+        path = prefix + (key,)
+        flat[path] = val
+        flat.update(flatten_values(val, path))
+    return flat
+
+
+def _values_digest(values) -> str:
+    """Stable digest of parsed values, used to detect tests mutating shared data."""
+    return hashlib.sha256(json.dumps(values, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+@pytest.fixture(scope='session')
+def values_and_path():
+    """
+    (values, source_path) from get_values_for_test(), resolved once per session.
+    The dict is shared by every test in the session (or xdist worker), so it is
+    checked at teardown to make sure no test modified it in place.
+    """
+    values, path = get_values_for_test()
+    digest = _values_digest(values)
+    yield values, path
+    assert _values_digest(values) == digest, \
+        "A test mutated the shared session values; deepcopy before modifying"
+
+
+@pytest.fixture(scope='session')
+def values(values_and_path):
+    """Parsed values from values_and_path."""
+    return values_and_path[0]
+
+
+@pytest.fixture(scope='session')
+def path(values_and_path):
+    """Source path from values_and_path, used as the log_check source."""
+    return values_and_path[1]
+
+
+# HA-relevant settings pulled out of the values once, for the HA configuration tests
+HAConfig = namedtuple(
+    'HAConfig',
+    ['values', 'path', 'pxc_size', 'pxc_affinity', 'proxysql_enabled', 'haproxy_enabled']
+)
+
+
+@pytest.fixture(scope='session')
+def ha_config(values_and_path):
+    """HAConfig resolved once per session from values_and_path."""
+    values, path = values_and_path
+    pxc = values.get('pxc', {})
+    return HAConfig(
+        values=values,
+        path=path,
+        pxc_size=pxc.get('size'),
+        pxc_affinity=pxc.get('affinity', {}),
+        proxysql_enabled=bool(values.get('proxysql', {}).get('enabled')),
+        haproxy_enabled=bool(values.get('haproxy', {}).get('enabled')),
+    )
+
+
+@pytest.fixture(scope='session')
+def proxy_mode(values):
+    """Enabled proxy layer: 'proxysql', 'haproxy', or None. ProxySQL wins if both are enabled."""
+    if values.get('proxysql', {}).get('enabled'):
+        return 'proxysql'
+    if values.get('haproxy', {}).get('enabled'):
+        return 'haproxy'
+    return None
+
+
+@pytest.fixture(scope='session')
+def values_flat(values_and_path):
+    """Values flattened once per session by flatten_values()."""
+    values, _ = values_and_path
+    return flatten_values(values)
+
+
+@pytest.fixture(scope='session')
+def schedules_by_name(values_and_path):
+    """Backup schedules keyed by schedule name."""
+    values, _ = values_and_path
+    return {s['name']: s for s in values.get('backup', {}).get('schedule', [])}
+
+
+# Cron format: minute hour day-of-month month day-of-week
+CRON_FIELDS = ('minute', 'hour', 'day_of_month', 'month', 'day_of_week')
+CRON_RE = re.compile(r'\s*(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s*')
+
+
+@pytest.fixture(scope='session')
+def parsed_schedules(values_and_path):
+    """
+    Backup schedules with their cron expression split into named fields once per session.
+    'cron' is None when the expression does not have exactly five fields.
+    """
+    values, _ = values_and_path
+    parsed = []
+    for s in values.get('backup', {}).get('schedule', []):
+        m = CRON_RE.fullmatch(s.get('schedule') or '')
+        parsed.append({
+            'name': s.get('name', 'unknown'),
+            'schedule': s.get('schedule'),
+            'cron': dict(zip(CRON_FIELDS, m.groups())) if m else None,
+            'retention': s.get('retention'),
+            'storageName': s.get('storageName'),
+        })
+    return parsed
+
+
+def find_manifest_doc(kind, predicate=None):
+    """
+    Return the first document of the given kind in FLEET_RENDERED_MANIFEST for
+    which predicate(doc) is true (any, if predicate is None), or None.
+    The manifest is streamed, so parsing stops at the match.
+    """
+    with open(FLEET_RENDERED_MANIFEST, 'r', encoding='utf-8') as f:
+        for doc in yaml.load_all(f, Loader=YAML_LOADER):
+            if doc and doc.get('kind') == kind and (predicate is None or predicate(doc)):
+                return doc
+    return None
+
+
+def log_check(criterion: str, expected, actual, source: str = ""):
     """
     Log a criterion/result pair for test assertions in verbose mode.
     Only prints detailed information when verbose mode is enabled.
+    expected/actual may be strings or zero-arg callables returning strings;
+    callables are only invoked in verbose mode.
     
     Example:
       Criterion: pxc size should be in [3,5]
@@ -197,15 +434,54 @@ def log_check(criterion: str, expected: str, actual: str, source: str = ""):
     if not verbose:
         return
     
+    print(_format_check(criterion, expected, actual, source))
+
+
+def _format_check(criterion, expected, actual, source=""):
+    """
+    Render one criterion/result record as the three lines log_check prints.
+    expected/actual may be zero-arg callables so callers can defer building
+    the string until verbose mode actually needs it.
+    """
+    if callable(expected):
+        expected = expected()
+    if callable(actual):
+        actual = actual()
     prefix = "[dim]"
-    if source:
-        print(f"{prefix}Criterion: {criterion}")
-        print(f"{prefix}Expected:  {expected}")
-        print(f"{prefix}Actual:    {actual} (source: {source})")
-    else:
-        print(f"{prefix}Criterion: {criterion}")
-        print(f"{prefix}Expected:  {expected}")
-        print(f"{prefix}Actual:    {actual}")
+    suffix = f" (source: {source})" if source else ""
+    return (
+        f"{prefix}Criterion: {criterion}\n"
+        f"{prefix}Expected:  {expected}\n"
+        f"{prefix}Actual:    {actual}{suffix}"
+    )
+
+
+class _LogBatch:
+    """
+    Buffers log_check records for a single test and writes them in one call.
+    Records are only kept in verbose mode, mirroring log_check.
+    """
+
+    def __init__(self):
+        self.verbose = os.getenv('VERBOSE') == 'true'
+        self.buf = []
+
+    def check(self, criterion, expected, actual, source=""):
+        if self.verbose:
+            self.buf.append(_format_check(criterion, expected, actual, source))
+
+    def flush(self):
+        if self.buf:
+            sys.stdout.write("\n".join(self.buf) + "\n")
+            self.buf.clear()
+
+
+@pytest.fixture
+def log():
+    """Batched log_check for one test, flushed once at teardown."""
+    batch = _LogBatch()
+    yield batch
+    batch.flush()
 
 def _env_context_summary():
     """Return a concise single-line environment context summary for logs."""
@@ -276,9 +552,92 @@ def pytest_runtest_logreport(report):
             if hasattr(report, 'wasxfail'):
                 print(f"Reason: {report.wasxfail}")
 
+# urllib3 connections kept per host by the shared ApiClient (library default: 4)
+K8S_CONNECTION_POOL_MAXSIZE = int(os.getenv('K8S_CONNECTION_POOL_MAXSIZE', '32'))
+
+# On-disk cache for read-only API calls (enabled with --use-k8s-cache)
+K8S_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'k8s.sqlite')
+K8S_CACHE_TTL_SECONDS = int(os.getenv('K8S_CACHE_TTL_SECONDS', '60'))
+
+
+def _install_k8s_response_cache(api_client, path=K8S_CACHE_PATH, expire_after=K8S_CACHE_TTL_SECONDS):
+    """
+    Cache successful GET responses of api_client in SQLite so repeated runs of the
+    same tests within expire_after seconds skip the API server round-trip.
+    The Kubernetes client talks to urllib3 directly, so the cache wraps its
+    PoolManager.request. Watches and all non-GET verbs always go to the server.
+    """
+    import sqlite3
+    import time
+    import urllib3
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    db = sqlite3.connect(path, check_same_thread=False)
+    db.execute(
+        'CREATE TABLE IF NOT EXISTS responses '
+        '(key TEXT PRIMARY KEY, status INTEGER, reason TEXT, headers TEXT, body BLOB, created REAL)'
+    )
+
+    pool_manager = api_client.rest_client.pool_manager
+    uncached_request = pool_manager.request
+
+    def cached_request(method, url, *args, **kwargs):
+        query = dict(kwargs.get('fields') or {})
+        if method != 'GET' or 'watch=true' in url or query.get('watch'):
+            return uncached_request(method, url, *args, **kwargs)
+
+        key = json.dumps([url, sorted(query.items())], default=str)
+        row = db.execute(
+            'SELECT status, reason, headers, body FROM responses WHERE key = ? AND created > ?',
+            (key, time.time() - expire_after)
+        ).fetchone()
+        if row is None:
+            response = uncached_request(method, url, *args, **dict(kwargs, preload_content=True))
+            row = (response.status, response.reason, json.dumps(dict(response.headers)), response.data)
+            if response.status == 200:
+                db.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)', (key, *row, time.time()))
+                db.commit()
+
+        status, reason, headers, body = row
+        return urllib3.HTTPResponse(
+            body=body,
+            headers=json.loads(headers),
+            status=status,
+            reason=reason,
+            preload_content=kwargs.get('preload_content', True)
+        )
+
+    pool_manager.request = cached_request
+    console.print(f"[dim]Kubernetes API GET cache enabled: {path} (TTL {expire_after}s)[/dim]")
+
+
+_RESILIENCY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resiliency')
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Turn --use-k8s-cache off when resiliency/DR tests are selected: their readiness
+    checks and recovery waits share the API client and would read frozen pre-chaos state.
+    """
+    if not config.getoption('--use-k8s-cache', default=False):
+        return
+    if any(
+        item.get_closest_marker('resiliency') or item.get_closest_marker('dr_scenario')
+        or str(item.path).startswith(_RESILIENCY_DIR + os.sep)
+        for item in items
+    ):
+        config.option.use_k8s_cache = False
+        console.print("[yellow]⚠ --use-k8s-cache ignored: resiliency/DR tests need live API responses[/yellow]")
+
+
 @pytest.fixture(scope="session")
-def k8s_client():
-    """Initialize Kubernetes API client"""
+def k8s_client(request):
+    """
+    Initialize the Kubernetes API client shared by every *_v1 API fixture.
+    One ApiClient means one urllib3 pool, so TLS connections are reused across
+    API groups; the pool is sized for concurrent fan-out reads.
+    """
+    from kubernetes import client, config
     try:
         config.load_incluster_config()
         console.print("[green]✓[/green] Using in-cluster Kubernetes config")
@@ -289,39 +648,254 @@ def k8s_client():
         except Exception as e:
             pytest.fail(f"Could not load Kubernetes config: {e}")
     
-    return client.ApiClient()
+    cfg = client.Configuration.get_default_copy()
+    cfg.connection_pool_maxsize = K8S_CONNECTION_POOL_MAXSIZE
+    # Ad-hoc client.XxxApi() calls (e.g. in chaos helpers) pick up the same settings
+    client.Configuration.set_default(cfg)
+    api_client = client.ApiClient(configuration=cfg)
+    if request.config.getoption('--use-k8s-cache', default=False):
+        _install_k8s_response_cache(api_client)
+    return api_client
 
 
 @pytest.fixture(scope="session")
 def core_v1(k8s_client):
     """Core V1 API client"""
+    from kubernetes import client
     return client.CoreV1Api(k8s_client)
 
 
 @pytest.fixture(scope="session")
 def apps_v1(k8s_client):
     """Apps V1 API client"""
+    from kubernetes import client
     return client.AppsV1Api(k8s_client)
 
 
 @pytest.fixture(scope="session")
 def custom_objects_v1(k8s_client):
     """Custom Objects V1 API client"""
+    from kubernetes import client
     return client.CustomObjectsApi(k8s_client)
 
 
 @pytest.fixture(scope="session")
 def policy_v1(k8s_client):
     """Policy V1 API client"""
+    from kubernetes import client
     return client.PolicyV1Api(k8s_client)
 
 
 @pytest.fixture(scope="session")
 def storage_v1(k8s_client):
     """Storage V1 API client"""
+    from kubernetes import client
     return client.StorageV1Api(k8s_client)
 
 
+@pytest.fixture(scope="session")
+def batch_v1(k8s_client):
+    """Batch V1 API client"""
+    from kubernetes import client
+    return client.BatchV1Api(k8s_client)
+
+
+
+@pytest.fixture(scope="session")
+def dr_namespace(request):
+    """
+    Namespace of the cluster a DR test breaks. Under pytest-xdist each worker
+    gets its own entry of DR_NAMESPACES so concurrent chaos runs never touch the
+    same cluster; without it every test uses TEST_NAMESPACE.
+    """
+    worker_id = getattr(request.config, 'workerinput', {}).get('workerid', 'master')
+    if not DR_NAMESPACES or worker_id == 'master':
+        return TEST_NAMESPACE
+    return DR_NAMESPACES[int(worker_id.lstrip('gw')) % len(DR_NAMESPACES)]
+
+
+@pytest.fixture(scope="session")
+def mysql_pod(core_v1, dr_namespace):
+    """Name of a PXC pod in dr_namespace, looked up once per session"""
+    from resiliency.helpers import get_mysql_pod
+    return get_mysql_pod(core_v1, dr_namespace, TEST_CLUSTER_NAME)
+
+
+# Label the Percona operator puts on every component object (pxc, proxysql, haproxy)
+COMPONENT_LABEL = 'app.kubernetes.io/component'
+
+ClusterSnapshot = namedtuple(
+    'ClusterSnapshot',
+    ['statefulsets', 'sts_by_component', 'pdbs_by_component', 'pvcs', 'pvcs_by_component',
+     'pxc_container', 'proxysql_container']
+)
+
+
+def _bucket_by_component(items, labels_of):
+    """Group API objects by their component label in a single pass"""
+    buckets = {'pxc': [], 'proxysql': [], 'haproxy': []}
+    for item in items:
+        component = (labels_of(item) or {}).get(COMPONENT_LABEL)
+        if component:
+            buckets.setdefault(component, []).append(item)
+    return buckets
+
+
+def _main_container(statefulsets, *names):
+    """Return the first container named one of names in the first StatefulSet, or None"""
+    if not statefulsets:
+        return None
+    containers = {c.name: c for c in statefulsets[0].spec.template.spec.containers}
+    return next((containers[name] for name in names if name in containers), None)
+
+
+@pytest.fixture(scope="session")
+def cluster_snapshot(apps_v1, core_v1, policy_v1):
+    """
+    List StatefulSets, PDBs and PVCs in the test namespace once per session and
+    bucket them by component, so integration tests look up e.g.
+    cluster_snapshot.sts_by_component['proxysql'] instead of re-listing and
+    filtering by name.
+    """
+    from kubernetes import client
+
+    statefulsets = apps_v1.list_namespaced_stateful_set(namespace=TEST_NAMESPACE).items
+    pvcs = core_v1.list_namespaced_persistent_volume_claim(namespace=TEST_NAMESPACE).items
+    try:
+        pdbs = policy_v1.list_namespaced_pod_disruption_budget(namespace=TEST_NAMESPACE).items
+    except client.exceptions.ApiException as e:
+        console.print(f"[yellow]⚠ Could not list PodDisruptionBudgets:[/yellow] {e.reason}")
+        pdbs = []
+
+    sts_by_component = _bucket_by_component(statefulsets, lambda sts: sts.metadata.labels)
+
+    return ClusterSnapshot(
+        statefulsets=statefulsets,
+        sts_by_component=sts_by_component,
+        pdbs_by_component=_bucket_by_component(
+            pdbs, lambda pdb: pdb.spec.selector.match_labels if pdb.spec.selector else None
+        ),
+        pvcs=pvcs,
+        pvcs_by_component=_bucket_by_component(pvcs, lambda pvc: pvc.metadata.labels),
+        pxc_container=_main_container(sts_by_component['pxc'], 'pxc', 'mysql'),
+        proxysql_container=_main_container(sts_by_component['proxysql'], 'proxysql'),
+    )
+
+
+
+def _labels_match(labels, selector):
+    """Match an equality-based label selector ('a=b,c=d') against a labels dict"""
+    labels = labels or {}
+    terms = (term.partition('=') for term in selector.split(',') if term)
+    return all(labels.get(key.strip()) == value.strip() for key, _, value in terms)
+
+
+class K8sInformerCache:
+    """
+    List+Watch cache of namespaced objects, keyed by kind.
+    Each kind is listed once with resourceVersion=0 (served from the API
+    server's watch cache) and kept current by a background watch, so label
+    lookups are answered from memory instead of a LIST per test.
+    """
+
+    WATCH_TIMEOUT_SECONDS = 60
+
+    def __init__(self, namespace, **list_fns):
+        self.namespace = namespace
+        self._list_fns = list_fns
+        self._objects = {kind: {} for kind in list_fns}
+        self._watches = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    def start(self):
+        """Prime every kind synchronously, then keep it current in the background"""
+        for kind, list_fn in self._list_fns.items():
+            resource_version = self._relist(kind, list_fn)
+            threading.Thread(
+                target=self._watch, args=(kind, list_fn, resource_version), daemon=True
+            ).start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        for w in list(self._watches.values()):
+            w.stop()
+
+    def _relist(self, kind, list_fn):
+        result = list_fn(namespace=self.namespace, resource_version='0')
+        with self._lock:
+            self._objects[kind] = {obj.metadata.name: obj for obj in result.items}
+        return result.metadata.resource_version
+
+    def _watch(self, kind, list_fn, resource_version):
+        from kubernetes import watch
+
+        while not self._stopped.is_set():
+            w = self._watches[kind] = watch.Watch()
+            try:
+                for event in w.stream(
+                    list_fn,
+                    namespace=self.namespace,
+                    resource_version=resource_version,
+                    timeout_seconds=self.WATCH_TIMEOUT_SECONDS
+                ):
+                    obj = event['object']
+                    with self._lock:
+                        if event['type'] == 'DELETED':
+                            self._objects[kind].pop(obj.metadata.name, None)
+                        else:
+                            self._objects[kind][obj.metadata.name] = obj
+                resource_version = w.resource_version or resource_version
+            except Exception:
+                # Typically 410 Gone once resource_version leaves the watch window: relist
+                if self._stopped.wait(1):
+                    break
+                try:
+                    resource_version = self._relist(kind, list_fn)
+                except Exception:
+                    pass
+
+    def _by_label(self, kind, selector):
+        with self._lock:
+            objects = [obj for obj in self._objects[kind].values() if _labels_match(obj.metadata.labels, selector)]
+        return sorted(objects, key=lambda obj: obj.metadata.name)
+
+    def services_by_label(self, selector):
+        return self._by_label('services', selector)
+
+    def statefulsets_by_label(self, selector):
+        return self._by_label('statefulsets', selector)
+
+    def pods_by_label(self, selector):
+        return self._by_label('pods', selector)
+
+
+@pytest.fixture(scope="session")
+def k8s_cache_for(core_v1, apps_v1):
+    """Return a started K8sInformerCache per namespace, created on first use"""
+    caches = {}
+
+    def get(namespace):
+        if namespace not in caches:
+            caches[namespace] = K8sInformerCache(
+                namespace,
+                services=core_v1.list_namespaced_service,
+                statefulsets=apps_v1.list_namespaced_stateful_set,
+                pods=core_v1.list_namespaced_pod,
+            ).start()
+        return caches[namespace]
+
+    yield get
+    for cache in caches.values():
+        cache.stop()
+
+
+@pytest.fixture(scope="session")
+def k8s_cache(k8s_cache_for):
+    """Informer-style cache of Services, StatefulSets and Pods in the test namespace"""
+    return k8s_cache_for(TEST_NAMESPACE)
+
 def kubectl_cmd(cmd_list):
     """Execute kubectl command and return JSON result"""
     try:
@@ -402,7 +976,7 @@ def trigger_chaos_for_resiliency_tests(request):
     console.print("[dim]Note: Tests will run and verify recovery even if chaos experiments complete before tests start[/dim]")
     
     try:
-        from tests.resiliency.chaos_integration import (
+        from resiliency.chaos_integration import (
             trigger_chaos_experiment,
             wait_for_chaos_completion
         )
@@ -463,6 +1037,9 @@ def trigger_chaos_for_resiliency_tests(request):
         
         # Store engine names for cleanup later
         request.session.chaos_engines = [e for e in [pxc_engine, proxysql_engine] if e]
+        # Let recovery tests look up the ChaosResult of the experiment that targeted them
+        from resiliency.helpers import CHAOS_ENGINES
+        request.config.stash[CHAOS_ENGINES] = {'pxc': pxc_engine, 'proxysql': proxysql_engine}
         
     except Exception as e:
         import traceback
@@ -476,9 +1053,9 @@ def trigger_chaos_for_resiliency_tests(request):
     # Cleanup chaos engines after tests complete
     try:
         if hasattr(request.session, 'chaos_engines') and request.session.chaos_engines:
-            from kubernetes import client, config
-            config.load_kube_config()
-            custom_objects_v1 = client.CustomObjectsApi()
+            from kubernetes import client
+            from resiliency.chaos_integration import load_k8s_config
+            custom_objects_v1 = client.CustomObjectsApi(load_k8s_config())
             chaos_namespace = os.getenv('CHAOS_NAMESPACE', 'litmus')
             
             for engine_name in request.session.chaos_engines:
@@ -4,8 +4,7 @@ Test that backup schedules are configured
 import pytest
 import json
 import subprocess
-from kubernetes import client
-from conftest import TEST_NAMESPACE, TEST_CLUSTER_NAME, TEST_BACKUP_TYPE, TEST_BACKUP_BUCKET
+from conftest import TEST_NAMESPACE
 from rich.console import Console
 
 console = Console()
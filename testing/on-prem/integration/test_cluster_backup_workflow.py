@@ -3,8 +3,7 @@ Integration tests for backup workflow.
 Validates that backup schedules are created and functional.
 """
 import pytest
-import time
-from conftest import TEST_NAMESPACE, TEST_CLUSTER_NAME
+from conftest import TEST_NAMESPACE
 from kubernetes import client
 from rich.console import Console
 
@@ -3,7 +3,6 @@ Integration tests for cluster scaling operations.
 Validates that cluster can be scaled up/down properly.
 """
 import pytest
-import time
 from conftest import TEST_NAMESPACE, TEST_CLUSTER_NAME
 from kubernetes import client
 from rich.console import Console
@@ -42,7 +41,7 @@ def test_cluster_can_scale_up(apps_v1, custom_objects_v1):
 
 
 @pytest.mark.integration
-def test_statefulset_replicas_match_cluster_size(apps_v1):
+def test_statefulset_replicas_match_cluster_size(apps_v1, custom_objects_v1):
     """Test that StatefulSet replicas match the cluster size configuration."""
     # Check PXC StatefulSet
     try:
@@ -53,8 +52,6 @@ def test_statefulset_replicas_match_cluster_size(apps_v1):
         pxc_replicas = pxc_sts.spec.replicas
         
         # Get cluster size from custom resource
-        from kubernetes import client
-        custom_objects_v1 = client.CustomObjectsApi()
         group = 'pxc.percona.com'
         version = 'v1'
         plural = 'perconaxtradbclusters'
@@ -80,7 +77,7 @@ def test_statefulset_replicas_match_cluster_size(apps_v1):
 
 
 @pytest.mark.integration
-def test_proxysql_replicas_match_cluster_size(apps_v1):
+def test_proxysql_replicas_match_cluster_size(apps_v1, custom_objects_v1):
     """Test that ProxySQL StatefulSet replicas match the cluster size."""
     try:
         proxysql_sts = apps_v1.read_namespaced_stateful_set(
@@ -90,8 +87,6 @@ def test_proxysql_replicas_match_cluster_size(apps_v1):
         proxysql_replicas = proxysql_sts.spec.replicas
         
         # Get cluster size
-        from kubernetes import client
-        custom_objects_v1 = client.CustomObjectsApi()
         group = 'pxc.percona.com'
         version = 'v1'
         plural = 'perconaxtradbclusters'
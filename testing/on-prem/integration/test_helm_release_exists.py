@@ -4,7 +4,7 @@ Test that Helm release exists for the cluster
 import pytest
 import json
 import subprocess
-from conftest import TEST_NAMESPACE, TEST_CLUSTER_NAME, TEST_EXPECTED_NODES
+from conftest import TEST_NAMESPACE, TEST_CLUSTER_NAME
 from rich.console import Console
 
 console = Console()
@@ -19,7 +19,6 @@ def test_helm_release_exists():
         check=True
     )
 
-    import json
     releases = json.loads(result.stdout)
 
     cluster_release = next(
@@ -4,8 +4,6 @@ Test that Kubernetes version is compatible with Percona Operator (>= 1.24)
 import pytest
 import json
 import subprocess
-from kubernetes import client
-from conftest import kubectl_cmd, TEST_NAMESPACE, TEST_CLUSTER_NAME, TEST_EXPECTED_NODES
 from rich.console import Console
 
 console = Console()
@@ -2,8 +2,7 @@
 Test that StatefulSet pod templates can have tolerations (optional check)
 """
 import pytest
-from kubernetes import client
-from conftest import TEST_NAMESPACE, TEST_EXPECTED_NODES
+from conftest import TEST_NAMESPACE
 from rich.console import Console
 
 console = Console()
@@ -2,18 +2,14 @@
 Test that ProxySQL StatefulSet has anti-affinity rules
 """
 import pytest
-from kubernetes import client
-from conftest import TEST_NAMESPACE, TEST_EXPECTED_NODES
 from rich.console import Console
 
 console = Console()
 
 @pytest.mark.integration
-def test_proxysql_anti_affinity_rules(apps_v1):
+def test_proxysql_anti_affinity_rules(cluster_snapshot):
     """Test that ProxySQL StatefulSet has anti-affinity rules"""
-    # Get all StatefulSets and find ProxySQL by name pattern
-    sts_list = apps_v1.list_namespaced_stateful_set(namespace=TEST_NAMESPACE)
-    proxysql_sts = [sts for sts in sts_list.items if 'proxysql' in sts.metadata.name]
+    proxysql_sts = cluster_snapshot.sts_by_component['proxysql']
 
     assert len(proxysql_sts) > 0, "ProxySQL StatefulSet not found"
 
@@ -2,24 +2,15 @@
 Test that PDB exists for ProxySQL StatefulSet
 """
 import pytest
-from kubernetes import client
-from conftest import TEST_NAMESPACE
 from rich.console import Console
 
 console = Console()
 
 @pytest.mark.integration
-def test_proxysql_pdb_exists(policy_v1):
+def test_proxysql_pdb_exists(cluster_snapshot):
     """Test that PDB exists for ProxySQL StatefulSet"""
     try:
-        pdb_list = policy_v1.list_namespaced_pod_disruption_budget(
-            namespace=TEST_NAMESPACE
-        )
-
-        proxysql_pdbs = [
-            pdb for pdb in pdb_list.items
-            if 'proxysql' in pdb.metadata.name.lower()
-        ]
+        proxysql_pdbs = cluster_snapshot.pdbs_by_component['proxysql']
 
         assert len(proxysql_pdbs) > 0, \
             "Pod Disruption Budget for ProxySQL not found"
@@ -2,27 +2,17 @@
 Test that ProxySQL resources match expected values (100m CPU, 256Mi memory request)
 """
 import pytest
-from kubernetes import client
-from conftest import TEST_NAMESPACE
 from rich.console import Console
 
 console = Console()
 
 @pytest.mark.integration
-def test_proxysql_resource_values(apps_v1):
+def test_proxysql_resource_values(cluster_snapshot):
     """Test that ProxySQL resources match expected values (100m CPU, 256Mi memory request)"""
-    # Get all StatefulSets and find ProxySQL by name pattern
-    sts_list = apps_v1.list_namespaced_stateful_set(namespace=TEST_NAMESPACE)
-    proxysql_sts = [sts for sts in sts_list.items if 'proxysql' in sts.metadata.name]
+    proxysql_sts = cluster_snapshot.sts_by_component['proxysql']
 
     assert len(proxysql_sts) > 0, "ProxySQL StatefulSet not found"
-    sts = proxysql_sts[0]
-    containers = sts.spec.template.spec.containers
-
-    proxysql_container = next(
-        (c for c in containers if 'proxysql' in c.name.lower()),
-        None
-    )
+    proxysql_container = cluster_snapshot.proxysql_container
 
     resources = proxysql_container.resources
     requests = resources.requests or {}
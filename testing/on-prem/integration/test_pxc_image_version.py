@@ -2,9 +2,7 @@
 Test PXC pod image versions are consistent
 """
 import pytest
-from kubernetes import client
-from kubernetes import client
-from conftest import kubectl_cmd, TEST_NAMESPACE, TEST_CLUSTER_NAME, TEST_EXPECTED_NODES
+from conftest import TEST_NAMESPACE
 from rich.console import Console
 
 console = Console()
@@ -19,18 +17,25 @@ def test_pxc_image_version(core_v1):
 
     assert len(pods.items) > 0, "No PXC pods found"
 
-    images = set()
+    # All PXC pods should use the same image version: compare against the
+    # first image seen and stop at the first mismatch
+    image = None
     for pod in pods.items:
         for container in pod.spec.containers:
-            if 'pxc' in container.name.lower() or 'mysql' in container.name.lower():
-                images.add(container.image)
-                console.print(f"[cyan]PXC Pod {pod.metadata.name} Image:[/cyan] {container.image}")
+            name = container.name.lower()
+            if 'pxc' not in name and 'mysql' not in name:
+                continue
+            if image is None:
+                image = container.image
+            elif container.image != image:
+                pytest.fail(
+                    f"PXC pods are using different image versions: {image} and "
+                    f"{container.image} (pod {pod.metadata.name})"
+                )
 
-    # All PXC pods should use the same image version
-    assert len(images) == 1, \
-        f"PXC pods are using different image versions: {images}"
+    assert image is not None, "No PXC containers found in PXC pods"
+    console.print(f"[cyan]PXC Image ({len(pods.items)} pods):[/cyan] {image}")
 
     # Verify image has a version tag
-    image = list(images)[0]
     assert ':' in image and image.split(':')[1] not in ('latest', ''), \
         f"PXC image should have a specific version tag, not 'latest' or empty: {image}"
@@ -2,27 +2,17 @@
 Test that PXC resources match expected values (500m CPU, 1Gi memory request)
 """
 import pytest
-from kubernetes import client
-from conftest import TEST_NAMESPACE
 from rich.console import Console
 
 console = Console()
 
 @pytest.mark.integration
-def test_pxc_resource_values(apps_v1):
+def test_pxc_resource_values(cluster_snapshot):
     """Test that PXC resources match expected values (500m CPU, 1Gi memory request)"""
-    # Get all StatefulSets and find PXC by name pattern
-    sts_list = apps_v1.list_namespaced_stateful_set(namespace=TEST_NAMESPACE)
-    pxc_sts = [sts for sts in sts_list.items if '-pxc' in sts.metadata.name and 'proxysql' not in sts.metadata.name]
+    pxc_sts = cluster_snapshot.sts_by_component['pxc']
 
     assert len(pxc_sts) > 0, "PXC StatefulSet not found"
-    sts = pxc_sts[0]
-    containers = sts.spec.template.spec.containers
-
-    pxc_container = next(
-        (c for c in containers if 'pxc' in c.name.lower() or 'mysql' in c.name.lower()),
-        None
-    )
+    pxc_container = cluster_snapshot.pxc_container
 
     resources = pxc_container.resources
     requests = resources.requests or {}
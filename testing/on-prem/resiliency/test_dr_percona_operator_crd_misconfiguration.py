@@ -10,8 +10,8 @@ Delete operator pod and verify it recovers and reconciles cluster
 """
 import pytest
 from kubernetes import client
-from tests.resiliency.chaos_integration import trigger_chaos_experiment, wait_for_chaos_completion
-from tests.resiliency.helpers import (
+from resiliency.chaos_integration import trigger_chaos_experiment, wait_for_chaos_completion
+from resiliency.helpers import (
     wait_for_cluster_recovery,
     wait_for_statefulset_recovery,
     wait_for_service_recovery,
@@ -2,12 +2,14 @@
 Test that ProxySQL StatefulSet recovers after pod deletion
 """
 import os
-import time
 import pytest
+from kubernetes import watch
 from rich.console import Console
-from conftest import TEST_NAMESPACE
-from tests.resiliency.helpers import (
+from conftest import TEST_NAMESPACE, CHAOS_NAMESPACE
+from resiliency.chaos_integration import get_chaos_engine_result
+from resiliency.helpers import (
     wait_for_statefulset_recovery,
+    CHAOS_ENGINES,
     DEFAULT_MTTR_TIMEOUT
 )
 
@@ -15,13 +17,12 @@ console = Console()
 
 
 @pytest.mark.resiliency
-def test_proxysql_statefulset_recovery(apps_v1, request):
+def test_proxysql_statefulset_recovery(apps_v1, k8s_cache, request):
     """Test that ProxySQL StatefulSet recovers after pod deletion"""
     console.print("[bold cyan]Starting ProxySQL StatefulSet recovery test...[/bold cyan]")
     
     console.print(f"[dim]Finding ProxySQL StatefulSet in namespace {TEST_NAMESPACE}...[/dim]")
-    sts_list = apps_v1.list_namespaced_stateful_set(namespace=TEST_NAMESPACE)
-    proxysql_sts = [sts for sts in sts_list.items if 'proxysql' in sts.metadata.name]
+    proxysql_sts = k8s_cache.statefulsets_by_label("app.kubernetes.io/component=proxysql")
     
     if not proxysql_sts:
         pytest.skip("ProxySQL StatefulSet not found")
@@ -40,35 +41,42 @@ def test_proxysql_statefulset_recovery(apps_v1, request):
     
     # Wait and check if replicas were reduced by chaos
     console.print(f"[cyan]Checking if StatefulSet {sts_name} was affected by chaos...[/cyan]")
-    max_wait = 60
-    start_time = time.time()
+    # The session chaos fixture already waited for its ProxySQL experiment; once the
+    # ChaosResult is Completed there is no breakage left to observe
+    engine_name = request.config.stash.get(CHAOS_ENGINES, {}).get('proxysql')
+    chaos_result = get_chaos_engine_result(CHAOS_NAMESPACE, engine_name) if engine_name else None
+    chaos_phase = (chaos_result or {}).get('status', {}).get('experimentStatus', {}).get('phase')
     sts_broken = False
-    check_count = 0
     
-    while time.time() - start_time < max_wait:
-        check_count += 1
-        elapsed = int(time.time() - start_time)
-        if check_count % 5 == 0 or check_count == 1:  # Print every 5th check or first check
-            console.print(f"[dim]  Check #{check_count} at {elapsed}s: Monitoring StatefulSet status...[/dim]")
+    if chaos_phase == 'Completed':
+        console.print(f"[dim]Chaos experiment {engine_name} already completed, skipping breakage watch[/dim]")
+    else:
+        max_wait = 60
         
+        # Server-push watch: reacts to the first status change instead of a 3s poll.
+        # resource_version="0" starts it from the API server's watch cache.
+        w = watch.Watch()
         try:
-            current_sts = apps_v1.read_namespaced_stateful_set(name=sts_name, namespace=TEST_NAMESPACE)
-            current_ready = current_sts.status.ready_replicas or 0
-            
-            if check_count % 5 == 0 or check_count == 1:  # Print status every 5th check
-                console.print(f"[dim]    Current status: {current_ready}/{expected_replicas} replicas ready[/dim]")
-            
-            if current_ready < expected_replicas:
-                console.print(f"[yellow]⚠ StatefulSet {sts_name} is broken: {current_ready}/{expected_replicas} replicas ready[/yellow]")
-                sts_broken = True
-                break
+            for event in w.stream(
+                apps_v1.list_namespaced_stateful_set,
+                namespace=TEST_NAMESPACE,
+                field_selector=f"metadata.name={sts_name}",
+                resource_version="0",
+                timeout_seconds=max_wait
+            ):
+                current_ready = event['object'].status.ready_replicas or 0
+                console.print(f"[dim]  {event['type']}: {current_ready}/{expected_replicas} replicas ready[/dim]")
+                if current_ready < expected_replicas:
+                    console.print(f"[yellow]⚠ StatefulSet {sts_name} is broken: {current_ready}/{expected_replicas} replicas ready[/yellow]")
+                    sts_broken = True
+                    break
         except Exception as e:
-            console.print(f"[yellow]⚠ Error checking StatefulSet: {e}[/yellow]")
+            console.print(f"[yellow]⚠ Error watching StatefulSet: {e}[/yellow]")
+        finally:
+            w.stop()
         
-        time.sleep(3)
-    
-    if not sts_broken:
-        console.print(f"[yellow]Note: StatefulSet {sts_name} was not affected by chaos (may have already recovered)[/yellow]")
+        if not sts_broken:
+            console.print(f"[yellow]Note: StatefulSet {sts_name} was not affected by chaos (may have already recovered)[/yellow]")
     
     try:
         mttr_timeout = getattr(request.config.option, 'mttr_timeout', None)
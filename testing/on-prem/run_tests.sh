@@ -46,6 +46,8 @@ export PROJECT_ROOT
 # Clean up any Python cache that might cause issues
 find . -type d -name __pycache__ -exec rm -rf {} + 2>/dev/null || true
 find . -type f -name "*.pyc" -delete 2>/dev/null || true
+# ...and don't write new bytecode (including pytest's rewritten test modules) that the next run deletes
+export PYTHONDONTWRITEBYTECODE=1
 
 # Set PYTHONPATH so conftest can be imported as a module
 export PYTHONPATH="${SCRIPT_DIR}:${PYTHONPATH:-}"
@@ -178,6 +180,8 @@ show_usage() {
     echo "  RESILIENCY_MTTR_TIMEOUT_SECONDS  MTTR timeout for resiliency tests (default: 120)"
     echo "  GENERATE_HTML_REPORT    Set to 'true' to generate HTML test report"
     echo "  GENERATE_COVERAGE       Set to 'true' to generate coverage report"
+    echo "  UNIT_WORKERS            pytest-xdist workers for unit tests (default: auto; 0 disables)"
+    echo "                          --verbose defaults this to 0: xdist workers do not relay log_check output"
     echo "  ON_PREM                 'true' to enable on-prem defaults (also via --on-prem)"
     echo "  STORAGE_CLASS_NAME      StorageClass name for on-prem (default: standard in on-prem)"
     echo "  TOPOLOGY_KEY            Anti-affinity topology key (default: hostname in on-prem, zone in EKS)"
@@ -682,6 +686,18 @@ else
     )
 fi
 
+# The runner never reruns from pytest's cache, so don't write .pytest_cache
+# unless a cache-based option (--lf, --ff, --nf, --sw, --cache-*) is passed through
+CACHE_NEEDED=false
+for arg in "${PYTEST_PASSTHROUGH[@]+"${PYTEST_PASSTHROUGH[@]}"}"; do
+    case "$arg" in
+        --lf|--last-failed|--ff|--failed-first|--nf|--new-first|--sw|--stepwise*|--cache-*) CACHE_NEEDED=true ;;
+    esac
+done
+if [ "$CACHE_NEEDED" = false ]; then
+    PYTEST_OPTS+=("-p" "no:cacheprovider")
+fi
+
 # Do not enable chaos globally. Chaos is only enabled for resiliency/DR stages.
 
 # Build pytest marker expression to exclude test categories
@@ -772,6 +788,8 @@ run_category() {
     local marker_expr="$2"     # pytest -m expression
     local trigger_chaos="$3"   # true/false
     local test_path="$4"       # directory to run
+    shift 4
+    local EXTRA_OPTS=("$@")    # category-specific pytest options
 
     local OPTS=("${PYTEST_OPTS[@]}")
     # Replace any previous -m with category-specific marker
@@ -791,6 +809,7 @@ run_category() {
     if [ "$trigger_chaos" = "true" ]; then
         OPTS+=("--trigger-chaos")
     fi
+    OPTS+=("${EXTRA_OPTS[@]+"${EXTRA_OPTS[@]}"}")
 
     # Add passthrough arguments
     local FINAL_TEST_PATH="$test_path"
@@ -849,7 +868,19 @@ if [ -n "$SPECIFIC_TEST_PATH" ]; then
 else
     # Run by category as before
     if [ "$NO_UNIT" == "false" ]; then
-        run_category "Unit tests" "unit" false "unit"
+        # Unit tests are independent; spread them over pytest-xdist workers (each parses values once).
+        # loadfile keeps a module on one worker so module-scoped fixtures are built once.
+        # Verbose runs stay serial by default since xdist swallows the workers' -s output.
+        UNIT_XDIST_OPTS=()
+        if [ "$VERBOSE" = "true" ]; then
+            unit_workers="${UNIT_WORKERS:-0}"
+        else
+            unit_workers="${UNIT_WORKERS:-auto}"
+        fi
+        if [ "$unit_workers" != "0" ]; then
+            UNIT_XDIST_OPTS=(-n "$unit_workers" --dist loadfile)
+        fi
+        run_category "Unit tests" "unit" false "unit" "${UNIT_XDIST_OPTS[@]+"${UNIT_XDIST_OPTS[@]}"}"
         [ $? -ne 0 ] && TEST_RESULT=1
     fi
 
@@ -877,6 +908,10 @@ if [ -n "${FLEET_RENDERED_MANIFEST:-}" ] && [ -f "$FLEET_RENDERED_MANIFEST" ]; t
     verbose_echo "Cleaning up rendered Fleet manifest: $FLEET_RENDERED_MANIFEST"
     rm -f "$FLEET_RENDERED_MANIFEST"
 fi
+# Also drop any parsed-values sidecars left next to it (<manifest>.<sha256>.json)
+if [ -n "${FLEET_RENDERED_MANIFEST:-}" ]; then
+    rm -f "$FLEET_RENDERED_MANIFEST".*.json
+fi
 
 # Skip warning counting - it can hang with fixtures and isn't critical
 # Warnings are visible if user runs with --show-warnings
@@ -2,11 +2,23 @@
 Unit tests for anti-affinity rules configuration.
 Validates that pods are distributed across availability zones per Percona best practices.
 """
-import os
-import yaml
 import pytest
 from conftest import log_check, TOPOLOGY_KEY, get_values_for_test
 
+# Accepted anti-affinity topology keys for this environment (hostname on-prem, zone on EKS)
+_ZONE_KEYS = frozenset({'topology.kubernetes.io/zone', 'failure-domain.beta.kubernetes.io/zone'})
+_HOST_KEYS = frozenset({'kubernetes.io/hostname'})
+ACCEPTED_KEYS = _HOST_KEYS if TOPOLOGY_KEY == 'kubernetes.io/hostname' else _ZONE_KEYS
+
+
+def _extract_topology_key(values_flat: dict, component: str) -> str | None:
+    """Return the required anti-affinity topology key from CR (antiAffinityTopologyKey) or raw podAntiAffinity format."""
+    key = values_flat.get((component, 'affinity', 'antiAffinityTopologyKey'))
+    if key is None:
+        key = values_flat.get((component, 'affinity', 'podAntiAffinity',
+                               'requiredDuringSchedulingIgnoredDuringExecution', 0, 'topologyKey'))
+    return key
+
 
 @pytest.mark.unit
 def test_pxc_anti_affinity_required():
@@ -42,86 +54,46 @@ def test_pxc_anti_affinity_required():
 
 
 @pytest.mark.unit
-def test_pxc_anti_affinity_topology_distribution():
-    """Test that PXC anti-affinity uses the correct topology key (zone on EKS, hostname on on-prem)."""
-    values, path = get_values_for_test()
+@pytest.mark.parametrize("component", ["pxc", "proxysql", "haproxy"])
+def test_component_anti_affinity_topology(component, values_flat, path):
+    """Test that each enabled component's anti-affinity uses the correct topology key (zone on EKS, hostname on on-prem)."""
+    if component != 'pxc' and not values_flat.get((component, 'enabled'), False):
+        pytest.skip(f"{component} is not enabled in this configuration")
     
-    pxc = values.get('pxc', {})
-    affinity = pxc.get('affinity', {})
-    
-    # Define accepted topology keys based on environment
-    accepted_keys = ['topology.kubernetes.io/zone', 'failure-domain.beta.kubernetes.io/zone']
-    if TOPOLOGY_KEY == 'kubernetes.io/hostname':
-        accepted_keys = ['kubernetes.io/hostname']
+    # Fleet CR format (antiAffinityTopologyKey) or raw values format (podAntiAffinity)
+    topology_key = _extract_topology_key(values_flat, component)
+    if topology_key is None:
+        pytest.fail(f"{component} must have either antiAffinityTopologyKey or podAntiAffinity configured")
     
-    # Check Fleet CR format or raw values format
-    if 'antiAffinityTopologyKey' in affinity:
-        topology_key = affinity['antiAffinityTopologyKey']
-        topo_found = topology_key in accepted_keys
-        log_check(
-            criterion=f"PXC antiAffinityTopologyKey should be in {accepted_keys}",
-            expected=f"in {accepted_keys}",
-            actual=f"antiAffinityTopologyKey={topology_key}, found={topo_found}",
-            source=path,
-        )
-        assert topo_found, f"PXC antiAffinityTopologyKey must be one of {accepted_keys}"
-    elif 'podAntiAffinity' in affinity:
-        pod_anti_affinity = affinity['podAntiAffinity']
-        required = pod_anti_affinity['requiredDuringSchedulingIgnoredDuringExecution'][0]
-        topology_key = required['topologyKey']
-        topo_found = topology_key in accepted_keys
-        log_check(
-            criterion=f"PXC podAntiAffinity topologyKey should be in {accepted_keys}",
-            expected=f"in {accepted_keys}",
-            actual=f"topologyKey={topology_key}, found={topo_found}",
-            source=path,
-        )
-        assert topo_found, f"PXC topologyKey must be one of {accepted_keys}"
-    else:
-        pytest.fail("PXC must have either antiAffinityTopologyKey or podAntiAffinity configured")
+    topo_found = topology_key in ACCEPTED_KEYS
+    log_check(
+        criterion=f"{component} anti-affinity topologyKey should be in {sorted(ACCEPTED_KEYS)}",
+        expected=f"in {sorted(ACCEPTED_KEYS)}",
+        actual=f"topologyKey={topology_key}, found={topo_found}",
+        source=path,
+    )
+    assert topo_found, f"{component} topologyKey must be one of {sorted(ACCEPTED_KEYS)}"
 
 
 @pytest.mark.unit
-def test_anti_affinity_prevents_single_host_or_zone_packing():
+def test_anti_affinity_prevents_single_host_or_zone_packing(values_flat, path):
     """Test that anti-affinity rules prevent all pods from being on same host (on-prem uses HAProxy)."""
-    values, path = get_values_for_test()
-    
-    pxc = values.get('pxc', {})
-    pxc_affinity = pxc.get('affinity', {})
-    
     # On-prem uses HAProxy
-    haproxy_enabled = values.get('haproxy', {}).get('enabled', False)
-    
-    if haproxy_enabled:
-        proxy = values.get('haproxy', {})
-        proxy_name = 'haproxy'
-    else:
+    if not values_flat.get(('haproxy', 'enabled'), False):
         pytest.skip("HAProxy is not enabled in this configuration")
+    proxy_name = 'haproxy'
     
-    proxy_affinity = proxy.get('affinity', {})
-    
-    accepted_keys = ['topology.kubernetes.io/zone', 'failure-domain.beta.kubernetes.io/zone'] if TOPOLOGY_KEY != 'kubernetes.io/hostname' else ['kubernetes.io/hostname']
-    
-    # Check PXC - Fleet CR format or raw values format
-    if 'antiAffinityTopologyKey' in pxc_affinity:
-        pxc_has_required = pxc_affinity['antiAffinityTopologyKey'] in accepted_keys
-    elif 'podAntiAffinity' in pxc_affinity:
-        pod_anti_affinity = pxc_affinity['podAntiAffinity']
-        required = pod_anti_affinity['requiredDuringSchedulingIgnoredDuringExecution'][0]
-        pxc_has_required = required['topologyKey'] in accepted_keys
-    else:
+    # Fleet CR format or raw values format
+    pxc_key = _extract_topology_key(values_flat, 'pxc')
+    if pxc_key is None:
         pytest.fail("PXC must have either antiAffinityTopologyKey or podAntiAffinity configured")
-    
-    # Check proxy - Fleet CR format or raw values format
-    if 'antiAffinityTopologyKey' in proxy_affinity:
-        proxy_has_required = proxy_affinity['antiAffinityTopologyKey'] in accepted_keys
-    elif 'podAntiAffinity' in proxy_affinity:
-        pod_anti_affinity = proxy_affinity['podAntiAffinity']
-        required = pod_anti_affinity['requiredDuringSchedulingIgnoredDuringExecution'][0]
-        proxy_has_required = required['topologyKey'] in accepted_keys
-    else:
+    proxy_key = _extract_topology_key(values_flat, proxy_name)
+    if proxy_key is None:
         pytest.fail(f"{proxy_name} must have either antiAffinityTopologyKey or podAntiAffinity configured")
     
+    pxc_has_required = pxc_key in ACCEPTED_KEYS
+    proxy_has_required = proxy_key in ACCEPTED_KEYS
+    
     log_check(
         criterion=f"Both PXC and {proxy_name} must include required anti-affinity topology",
         expected="both have required topology keys",
@@ -130,4 +102,3 @@ def test_anti_affinity_prevents_single_host_or_zone_packing():
     )
     assert pxc_has_required and proxy_has_required, \
         f"Both PXC and {proxy_name} must have required anti-affinity to ensure proper distribution"
-
@@ -2,42 +2,63 @@
 Unit tests for High Availability (HA) configuration.
 Validates HA settings match Percona best practices for v1.18.
 """
-import os
-import yaml
 import pytest
-from conftest import log_check, get_values_for_test
+from conftest import log_check
 
+# Every test in this module is a unit test
+pytestmark = pytest.mark.unit
 
-@pytest.mark.unit
-def test_minimum_cluster_size_for_ha():
+# Host- or zone-level spreading both satisfy HA on-prem
+_VALID_TOPOLOGY_KEYS = frozenset((
+    'kubernetes.io/hostname',
+    'topology.kubernetes.io/zone',
+    'failure-domain.beta.kubernetes.io/zone',
+))
+
+
+def _check_topology_keys(affinity: dict, component: str, rules_optional: bool = False):
+    """
+    Check a component's anti-affinity against _VALID_TOPOLOGY_KEYS.
+    Accepts the operator's antiAffinityTopologyKey or EKS-style podAntiAffinity rules.
+    Returns (ok, detail); ok is None when no anti-affinity is configured. A
+    podAntiAffinity block without required rules fails unless rules_optional.
+    """
+    if 'antiAffinityTopologyKey' in affinity:
+        topology_key = affinity['antiAffinityTopologyKey']
+        return topology_key in _VALID_TOPOLOGY_KEYS, f"{component} antiAffinityTopologyKey={topology_key}"
+    if 'podAntiAffinity' in affinity:
+        rules = affinity['podAntiAffinity'].get('requiredDuringSchedulingIgnoredDuringExecution', [])
+        if not rules:
+            return (None if rules_optional else False), f"{component} podAntiAffinity has no required rules"
+        keys = [rule.get('topologyKey') for rule in rules]
+        return any(key in _VALID_TOPOLOGY_KEYS for key in keys), f"{component} podAntiAffinity topologyKeys={keys}"
+    return None, f"{component} has no anti-affinity configured"
+
+
+def test_minimum_cluster_size_for_ha(ha_config, proxy_mode):
     """Test that cluster size meets minimum for high availability."""
-    values, path = get_values_for_test()
+    values = ha_config.values
     
-    pxc_size = values['pxc']['size']
-    
-    assert pxc_size >= 3, "PXC requires minimum 3 nodes for high availability"
+    assert ha_config.pxc_size >= 3, "PXC requires minimum 3 nodes for high availability"
     
     # On-prem uses HAProxy by default
-    if values.get('proxysql', {}).get('enabled'):
+    if proxy_mode == 'proxysql':
         proxysql_size = values['proxysql']['size']
         assert proxysql_size >= 3, "ProxySQL requires minimum 3 nodes for high availability"
-    elif values.get('haproxy', {}).get('enabled'):
+    elif proxy_mode == 'haproxy':
         haproxy_size = values['haproxy'].get('size', 1)
         assert haproxy_size >= 1, "HAProxy requires at least 1 node"
 
 
-@pytest.mark.unit
-def test_odd_node_count_preference():
+def test_odd_node_count_preference(ha_config):
     """Test that odd node counts are preferred for quorum (3, 5, 7 nodes)."""
-    values, path = get_values_for_test()
-    
-    node_count = values['pxc']['size']
+    node_count = ha_config.pxc_size
 
     # Emit explicit criterion/result for verbose clarity
     criterion = "PXC node count (<=5) should be one of [3, 5] to maintain quorum preference"
     expected_desc = "one of [3, 5]"
-    actual_desc = f"pxc size = {node_count}"
-    log_check(criterion=criterion, expected=expected_desc, actual=actual_desc, source=path)
+    actual_desc = lambda: f"pxc size = {node_count}"
+    log_check(criterion=criterion, expected=expected_desc, actual=actual_desc, source=ha_config.path)
     
     # While even numbers > 4 are acceptable, odd numbers are preferred
     # This test documents the best practice
@@ -48,108 +69,58 @@ def test_odd_node_count_preference():
             f"For clusters <= 5 nodes, odd count is preferred. Found {node_count}"
 
 
-@pytest.mark.unit
-def test_multi_az_anti_affinity():
+def test_multi_az_anti_affinity(ha_config, proxy_mode):
     """Test that anti-affinity rules ensure multi-AZ deployment."""
-    values, path = get_values_for_test()
+    # PXC must spread across hosts or zones
+    ok, detail = _check_topology_keys(ha_config.pxc_affinity, 'PXC')
+    log_check(
+        "PXC anti-affinity must use a valid topology key",
+        "kubernetes.io/hostname or zone key",
+        detail,
+        source=ha_config.path
+    )
+    assert ok, f"PXC must have topology-based anti-affinity for HA ({detail})"
     
-    # On-prem uses antiAffinityTopologyKey (Percona operator field)
-    pxc_affinity = values['pxc']['affinity']
-    
-    # Check for antiAffinityTopologyKey (on-prem uses simplified configuration)
-    if 'antiAffinityTopologyKey' in pxc_affinity:
-        topology_key = pxc_affinity['antiAffinityTopologyKey']
-        log_check(
-            "PXC antiAffinityTopologyKey must be set",
-            "kubernetes.io/hostname or zone key",
-            f"{topology_key}",
-            source=path
-        )
-        assert topology_key in ['kubernetes.io/hostname', 'topology.kubernetes.io/zone', 'failure-domain.beta.kubernetes.io/zone'], \
-            f"PXC antiAffinityTopologyKey must be set to a valid topology key, got: {topology_key}"
-    elif 'podAntiAffinity' in pxc_affinity:
-        # Fallback to podAntiAffinity for EKS-style configuration
-        pxc_rules = pxc_affinity['podAntiAffinity']['requiredDuringSchedulingIgnoredDuringExecution']
-        pxc_has_topology = any(
-            rule.get('topologyKey') in ['topology.kubernetes.io/zone', 'failure-domain.beta.kubernetes.io/zone', 'kubernetes.io/hostname']
-            for rule in pxc_rules
+    # Anti-affinity on the enabled proxy is optional but must be valid when set;
+    # a ProxySQL podAntiAffinity block must also carry required rules
+    if proxy_mode:
+        ok, detail = _check_topology_keys(
+            ha_config.values[proxy_mode].get('affinity', {}),
+            proxy_mode,
+            rules_optional=proxy_mode == 'haproxy',
         )
-        assert pxc_has_topology, "PXC must have topology-based anti-affinity for HA"
-    else:
-        assert False, "PXC must have anti-affinity configured (antiAffinityTopologyKey or podAntiAffinity)"
-    
-    # On-prem uses HAProxy by default, check proxy anti-affinity accordingly
-    if values.get('proxysql', {}).get('enabled'):
-        proxysql_affinity = values['proxysql'].get('affinity', {})
-        if 'antiAffinityTopologyKey' in proxysql_affinity:
-            topology_key = proxysql_affinity['antiAffinityTopologyKey']
-            assert topology_key in ['kubernetes.io/hostname', 'topology.kubernetes.io/zone', 'failure-domain.beta.kubernetes.io/zone'], \
-                f"ProxySQL antiAffinityTopologyKey must be set to a valid topology key, got: {topology_key}"
-        elif 'podAntiAffinity' in proxysql_affinity:
-            proxysql_rules = proxysql_affinity['podAntiAffinity']['requiredDuringSchedulingIgnoredDuringExecution']
-            proxysql_has_topology = any(
-                rule.get('topologyKey') in ['topology.kubernetes.io/zone', 'failure-domain.beta.kubernetes.io/zone', 'kubernetes.io/hostname']
-                for rule in proxysql_rules
-            )
-            assert proxysql_has_topology, "ProxySQL must have topology-based anti-affinity for HA"
-    elif values.get('haproxy', {}).get('enabled'):
-        # HAProxy anti-affinity is optional but recommended
-        haproxy_affinity = values['haproxy'].get('affinity', {})
-        if haproxy_affinity:
-            if 'antiAffinityTopologyKey' in haproxy_affinity:
-                topology_key = haproxy_affinity['antiAffinityTopologyKey']
-                assert topology_key in ['kubernetes.io/hostname', 'topology.kubernetes.io/zone', 'failure-domain.beta.kubernetes.io/zone'], \
-                    f"HAProxy antiAffinityTopologyKey must be set to a valid topology key, got: {topology_key}"
-            elif 'podAntiAffinity' in haproxy_affinity:
-                haproxy_rules = haproxy_affinity['podAntiAffinity'].get('requiredDuringSchedulingIgnoredDuringExecution', [])
-                if haproxy_rules:
-                    haproxy_has_topology = any(
-                        rule.get('topologyKey') in ['topology.kubernetes.io/zone', 'failure-domain.beta.kubernetes.io/zone', 'kubernetes.io/hostname']
-                        for rule in haproxy_rules
-                    )
-                    assert haproxy_has_topology, "HAProxy must have topology-based anti-affinity for HA"
-
-
-@pytest.mark.unit
-def test_proxy_enabled_for_ha():
+        assert ok is not False, f"{proxy_mode} anti-affinity must use a valid topology key ({detail})"
+
+
+def test_proxy_enabled_for_ha(ha_config):
     """Test that a proxy is enabled (required for HA load balancing)."""
-    values, path = get_values_for_test()
-    
     # On-prem uses HAProxy by default, but ProxySQL is also valid
-    proxysql_enabled = values.get('proxysql', {}).get('enabled', False)
-    haproxy_enabled = values.get('haproxy', {}).get('enabled', False)
-    
-    assert proxysql_enabled or haproxy_enabled, \
+    assert ha_config.proxysql_enabled or ha_config.haproxy_enabled, \
         "Either ProxySQL or HAProxy must be enabled for HA load balancing and connection management"
 
 
-@pytest.mark.unit
-def test_only_one_proxy_enabled():
+def test_only_one_proxy_enabled(ha_config):
     """Test that only one proxy is enabled at a time (avoids conflicts)."""
-    values, path = get_values_for_test()
-    
-    proxysql_enabled = values.get('proxysql', {}).get('enabled', False)
-    haproxy_enabled = values.get('haproxy', {}).get('enabled', False)
-    
     # Only one proxy should be enabled
-    assert proxysql_enabled != haproxy_enabled or (not proxysql_enabled and not haproxy_enabled), \
+    assert not (ha_config.proxysql_enabled and ha_config.haproxy_enabled), \
         "Only one proxy (ProxySQL or HAProxy) should be enabled at a time to avoid conflicts"
 
 
-@pytest.mark.unit
-def test_statefulset_replicas_configured_for_ha():
+def test_statefulset_replicas_configured_for_ha(ha_config, proxy_mode):
     """Test that PXC and proxy replicas are properly configured for HA."""
-    values, path = get_values_for_test()
+    if proxy_mode is None:
+        pytest.skip("No proxy enabled; replica alignment does not apply")
     
-    pxc_size = values['pxc']['size']
+    values = ha_config.values
+    pxc_size = ha_config.pxc_size
     
     # On-prem uses HAProxy by default
-    if values.get('proxysql', {}).get('enabled'):
+    if proxy_mode == 'proxysql':
         proxysql_size = values['proxysql']['size']
         # For proper HA, both should have matching replica counts
         assert pxc_size == proxysql_size, \
             f"PXC size ({pxc_size}) and ProxySQL size ({proxysql_size}) should match for proper HA configuration"
-    elif values.get('haproxy', {}).get('enabled'):
+    elif proxy_mode == 'haproxy':
         haproxy_size = values['haproxy'].get('size', 1)
         assert haproxy_size >= 1, \
             f"HAProxy size ({haproxy_size}) must be at least 1 for HA configuration"
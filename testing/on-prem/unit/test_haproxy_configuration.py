@@ -5,6 +5,12 @@ import os
 import pytest
 from conftest import log_check, TOPOLOGY_KEY, get_values_for_test
 
+# Zone-level keys (current and legacy label); hostname spreading is also accepted when
+# TOPOLOGY_KEY asks for it
+_ZONE_KEYS = frozenset(('topology.kubernetes.io/zone', 'failure-domain.beta.kubernetes.io/zone'))
+_ZONE_OR_HOST_KEYS = _ZONE_KEYS | {'kubernetes.io/hostname'}
+_ACCEPTED_TOPOLOGY_KEYS = _ZONE_OR_HOST_KEYS if TOPOLOGY_KEY == 'kubernetes.io/hostname' else _ZONE_KEYS
+
 
 @pytest.mark.unit
 def test_haproxy_enabled():
@@ -39,20 +45,15 @@ def test_haproxy_pdb_and_affinity_if_present():
     affinity = haproxy.get('affinity') or {}
     if 'antiAffinityTopologyKey' in affinity:
         topology_key = affinity['antiAffinityTopologyKey']
-        accepted_keys = ['topology.kubernetes.io/zone', 'failure-domain.beta.kubernetes.io/zone']
-        if TOPOLOGY_KEY == 'kubernetes.io/hostname':
-            accepted_keys = ['kubernetes.io/hostname', 'topology.kubernetes.io/zone', 'failure-domain.beta.kubernetes.io/zone']
-        log_check("HAProxy antiAffinityTopologyKey uses required topology key", f"in {accepted_keys}", f"{topology_key}", source=path)
-        assert topology_key in accepted_keys, f"HAProxy antiAffinityTopologyKey must be in {accepted_keys}, got {topology_key}"
+        log_check("HAProxy antiAffinityTopologyKey uses required topology key", lambda: f"in {sorted(_ACCEPTED_TOPOLOGY_KEYS)}", f"{topology_key}", source=path)
+        assert topology_key in _ACCEPTED_TOPOLOGY_KEYS, \
+            f"HAProxy antiAffinityTopologyKey must be in {sorted(_ACCEPTED_TOPOLOGY_KEYS)}, got {topology_key}"
     elif 'podAntiAffinity' in affinity:
         pod_anti_affinity = affinity['podAntiAffinity']
         required = pod_anti_affinity.get('requiredDuringSchedulingIgnoredDuringExecution', [])
         if required:
-            accepted_keys = ['topology.kubernetes.io/zone', 'failure-domain.beta.kubernetes.io/zone']
-            if TOPOLOGY_KEY == 'kubernetes.io/hostname':
-                accepted_keys = ['kubernetes.io/hostname', 'topology.kubernetes.io/zone', 'failure-domain.beta.kubernetes.io/zone']
-            topo_found = any((r.get('topologyKey') in accepted_keys) for r in required)
-            log_check("HAProxy anti-affinity uses required topology key", f"in {accepted_keys}", f"found={topo_found}", source=path)
+            topo_found = any(r.get('topologyKey') in _ACCEPTED_TOPOLOGY_KEYS for r in required)
+            log_check("HAProxy anti-affinity uses required topology key", lambda: f"in {sorted(_ACCEPTED_TOPOLOGY_KEYS)}", f"found={topo_found}", source=path)
             assert topo_found
 
 
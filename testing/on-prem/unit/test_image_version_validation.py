@@ -3,7 +3,6 @@ Unit tests for container image version validation.
 Validates that image versions match Percona Operator v1.18 recommendations.
 """
 import os
-import yaml
 import pytest
 import re
 from conftest import log_check, get_values_for_test
@@ -79,7 +78,7 @@ def test_haproxy_image_version_pinned():
 @pytest.mark.unit
 def test_operator_image_version_pinned():
     """Test that Percona Operator image is pinned to approved version for on-prem."""
-    from conftest import FLEET_RENDERED_MANIFEST
+    from conftest import FLEET_RENDERED_MANIFEST, find_manifest_doc
     
     expected_image = "percona/percona-xtradb-cluster-operator:1.18.0"
     
@@ -87,18 +86,10 @@ def test_operator_image_version_pinned():
     if not FLEET_RENDERED_MANIFEST or not os.path.exists(FLEET_RENDERED_MANIFEST):
         pytest.skip("Fleet rendered manifest not available")
     
-    with open(FLEET_RENDERED_MANIFEST, 'r', encoding='utf-8') as f:
-        docs = list(yaml.safe_load_all(f))
-    
-    # Find the operator Deployment
-    operator_deployment = None
-    for doc in docs:
-        if doc and doc.get('kind') == 'Deployment':
-            # Look for operator deployment (usually has 'operator' in the name)
-            name = doc.get('metadata', {}).get('name', '')
-            if 'operator' in name.lower():
-                operator_deployment = doc
-                break
+    # Look for operator deployment (usually has 'operator' in the name)
+    operator_deployment = find_manifest_doc(
+        'Deployment', lambda doc: 'operator' in doc.get('metadata', {}).get('name', '').lower()
+    )
     
     if not operator_deployment:
         pytest.skip("Operator Deployment not found in rendered manifest")
@@ -47,7 +47,7 @@ def test_percona_values_pxc_configuration():
         log_check("PXC anti-affinity selector operator", "In", f"{match_expr['operator']}", source=path); assert match_expr['operator'] == 'In'
         log_check("PXC anti-affinity selector values", "['pxc']", f"{match_expr['values']}", source=path); assert match_expr['values'] == ['pxc']
     else:
-        assert False, "PXC must have anti-affinity configured (antiAffinityTopologyKey or podAntiAffinity)"
+        pytest.fail("PXC must have anti-affinity configured (antiAffinityTopologyKey or podAntiAffinity)")
 
 
 @pytest.mark.unit
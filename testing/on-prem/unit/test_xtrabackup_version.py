@@ -3,9 +3,8 @@ Unit test for XtraBackup version validation.
 Validates that XtraBackup backup image version is 8.4.0-4.
 """
 import os
-import yaml
 import pytest
-from conftest import log_check, FLEET_RENDERED_MANIFEST
+from conftest import log_check, find_manifest_doc, FLEET_RENDERED_MANIFEST
 
 
 @pytest.mark.unit
@@ -42,15 +41,7 @@ def test_xtrabackup_version_pinned():
     if not FLEET_RENDERED_MANIFEST or not os.path.exists(FLEET_RENDERED_MANIFEST):
         pytest.skip("Fleet rendered manifest not available")
     
-    with open(FLEET_RENDERED_MANIFEST, 'r', encoding='utf-8') as f:
-        docs = list(yaml.safe_load_all(f))
-    
-    # Find the PerconaXtraDBCluster custom resource
-    pxc_cluster = None
-    for doc in docs:
-        if doc and doc.get('kind') == 'PerconaXtraDBCluster':
-            pxc_cluster = doc
-            break
+    pxc_cluster = find_manifest_doc('PerconaXtraDBCluster')
     
     if not pxc_cluster:
         pytest.skip("PerconaXtraDBCluster resource not found in rendered manifest")
@@ -109,15 +100,7 @@ def test_xtrabackup_image_not_latest():
     if not FLEET_RENDERED_MANIFEST or not os.path.exists(FLEET_RENDERED_MANIFEST):
         pytest.skip("Fleet rendered manifest not available")
     
-    with open(FLEET_RENDERED_MANIFEST, 'r', encoding='utf-8') as f:
-        docs = list(yaml.safe_load_all(f))
-    
-    # Find the PerconaXtraDBCluster custom resource
-    pxc_cluster = None
-    for doc in docs:
-        if doc and doc.get('kind') == 'PerconaXtraDBCluster':
-            pxc_cluster = doc
-            break
+    pxc_cluster = find_manifest_doc('PerconaXtraDBCluster')
     
     if not pxc_cluster:
         pytest.skip("PerconaXtraDBCluster resource not found in rendered manifest")
@@ -147,15 +130,7 @@ def test_xtrabackup_image_format():
     if not FLEET_RENDERED_MANIFEST or not os.path.exists(FLEET_RENDERED_MANIFEST):
         pytest.skip("Fleet rendered manifest not available")
     
-    with open(FLEET_RENDERED_MANIFEST, 'r', encoding='utf-8') as f:
-        docs = list(yaml.safe_load_all(f))
-    
-    # Find the PerconaXtraDBCluster custom resource
-    pxc_cluster = None
-    for doc in docs:
-        if doc and doc.get('kind') == 'PerconaXtraDBCluster':
-            pxc_cluster = doc
-            break
+    pxc_cluster = find_manifest_doc('PerconaXtraDBCluster')
     
     if not pxc_cluster:
         pytest.skip("PerconaXtraDBCluster resource not found in rendered manifest")